@@ -3,14 +3,16 @@
 PostgreSQL 데이터베이스와의 연결을 관리하고, SQLAlchemy를 사용하여 ORM 모델을 정의합니다.
 """
 
-from sqlalchemy import create_engine, Column, BigInteger, Text, Numeric, Integer, Boolean, DateTime, JSON, text
+from sqlalchemy import create_engine, event, Column, BigInteger, Text, Numeric, Integer, Boolean, DateTime, JSON, Index, text, and_
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.sql import func
 from datetime import datetime
 from typing import Optional
 import logging
+import orjson
 
 from app.core.config import DatabaseConfig
 
@@ -39,6 +41,7 @@ __all__ = [
     "SessionLocal",
     "get_db",
     "init_db",
+    "create_missing_indexes",
     "test_connection",
 ]
 
@@ -46,15 +49,46 @@ __all__ = [
 # SQLAlchemy Base 클래스 생성 (모든 모델이 상속받을 기본 클래스)
 Base = declarative_base()
 
+def _orjson_dumps(value) -> str:
+    """
+    JSON 컬럼 직렬화 함수
+    표준 json 대신 C로 구현된 orjson을 사용하여 시장 데이터처럼 큰 중첩 dict/float 리스트를 빠르게 직렬화합니다.
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+# 데이터베이스 연결 문자열 (SQLite 사용 시 전용 설정 적용)
+_connection_string = DatabaseConfig.get_connection_string()
+_is_sqlite = _connection_string.startswith("sqlite")
+# URL에 드라이버가 없으면 설치된 SQLAlchemy 버전의 기본 드라이버로 판별
+_is_psycopg2 = make_url(_connection_string).get_dialect().driver == "psycopg2"
+
 # 데이터베이스 엔진 생성 (연결 풀 관리)
 engine = create_engine(
-    DatabaseConfig.get_connection_string(),
+    _connection_string,
     pool_size=10,           # 연결 풀 크기
     max_overflow=20,        # 추가 연결 허용 수
     pool_pre_ping=True,      # 연결 유효성 자동 확인
-    echo=False              # SQL 쿼리 로그 출력 여부 (디버깅 시 True)
+    pool_recycle=1800,      # 30분 지난 연결은 재생성 (DB 서버 idle timeout 대비)
+    connect_args={"check_same_thread": False} if _is_sqlite else {},  # SQLite: 스레드 풀에서 연결 공유 허용
+    json_serializer=_orjson_dumps,  # JSON 컬럼 직렬화에 orjson 사용
+    echo=False,             # SQL 쿼리 로그 출력 여부 (디버깅 시 True)
+    # psycopg2: 여러 행 INSERT는 VALUES 묶음으로, 그 외 executemany(UPDATE 등)는 execute_batch로 전송
+    **({"executemany_mode": "values_plus_batch"} if _is_psycopg2 else {})
 )
 
+
+if _is_sqlite:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """SQLite 연결 생성 시 성능 PRAGMA 설정 (WAL 모드, 동기화 완화, 메모리 임시 저장소, mmap)"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
 # 세션 팩토리 생성 (데이터베이스 세션을 생성하는 함수)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -316,6 +350,71 @@ class AccountInformation(Base):
     total = Column(Numeric(30, 10), comment="총 자산 금액 (KRW 기준)")
     created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="레코드 생성 시각 (UTC)")
 
+
+# ==================== 인덱스 정의 ====================
+# 조회 패턴: WHERE market = ? [AND interval = ? AND period = ?] ORDER BY 시각 DESC LIMIT N
+# 복합 인덱스로 정렬 없이 인덱스 범위 스캔만으로 최신 N개 행을 찾을 수 있습니다.
+
+Index("idx_ticker_market_collected", UpbitTicker.market, UpbitTicker.collected_at.desc())
+Index(
+    "idx_accounts_account_currency_collected",
+    UpbitAccounts.account_id, UpbitAccounts.currency, UpbitAccounts.collected_at.desc(),
+    postgresql_include=["balance"]
+)
+Index("ux_candle3_market_time", UpbitCandlesMinute3.market, UpbitCandlesMinute3.candle_date_time_utc, unique=True)
+Index("ux_day_candle_market_time", UpbitDayCandles.market, UpbitDayCandles.candle_date_time_utc, unique=True)
+Index(
+    "idx_indicators_market_interval_time",
+    UpbitIndicators.market, UpbitIndicators.interval, UpbitIndicators.candle_date_time_utc.desc()
+)
+Index(
+    "idx_rsi_market_interval_period_time",
+    UpbitRSI.market, UpbitRSI.interval, UpbitRSI.period, UpbitRSI.candle_date_time_utc.desc()
+)
+
+# 통계 조회 패턴: 계정/기간별 잔액 변화, 신호-실행 기록 매칭, 사용자별 최신 자산 기록
+# INCLUDE 컬럼으로 테이블 접근 없이 인덱스 전용 스캔이 가능합니다.
+Index(
+    "idx_execution_account_executed_balance",
+    LLMTradingExecution.account_id, LLMTradingExecution.executed_at,
+    postgresql_include=["balance_before", "balance_after", "coin", "signal_type", "execution_status"],
+    postgresql_where=and_(
+        LLMTradingExecution.balance_before.isnot(None),
+        LLMTradingExecution.balance_after.isnot(None)
+    )
+)
+Index(
+    "idx_execution_prompt_coin_status",
+    LLMTradingExecution.prompt_id, LLMTradingExecution.coin, LLMTradingExecution.execution_status
+)
+Index(
+    "idx_signal_prompt_coin",
+    LLMTradingSignal.prompt_id, LLMTradingSignal.coin,
+    postgresql_include=["stop_loss", "profit_target"]
+)
+Index("idx_account_info_user_created", AccountInformation.user_id, AccountInformation.created_at.desc())
+
+# 성공한 실행 기록만 대상으로 하는 코인별 집계와 손절/익절가가 설정된 신호 조회용 부분/커버링 인덱스
+Index(
+    "idx_execution_success_coin_executed",
+    LLMTradingExecution.coin, LLMTradingExecution.executed_at,
+    postgresql_include=["account_id", "balance_before", "balance_after"],
+    postgresql_where=LLMTradingExecution.execution_status == "success"
+)
+Index(
+    "idx_signal_stop_loss_account_coin",
+    LLMTradingSignal.account_id, LLMTradingSignal.coin,
+    postgresql_include=["stop_loss", "prompt_id"],
+    postgresql_where=LLMTradingSignal.stop_loss.isnot(None)
+)
+Index(
+    "idx_signal_profit_target_account_coin",
+    LLMTradingSignal.account_id, LLMTradingSignal.coin,
+    postgresql_include=["profit_target", "prompt_id"],
+    postgresql_where=LLMTradingSignal.profit_target.isnot(None)
+)
+
+
 # ==================== 데이터베이스 유틸리티 함수 ====================
 
 def get_db() -> Session:
@@ -340,12 +439,27 @@ def init_db():
     """
     try:
         Base.metadata.create_all(bind=engine)
+        create_missing_indexes()
         logger.info("✅ 데이터베이스 테이블 초기화 완료")
     except Exception as e:
         logger.error(f"❌ 데이터베이스 초기화 실패: {e}")
         raise
 
 
+def create_missing_indexes():
+    """
+    모델에 정의된 인덱스 중 DB에 없는 인덱스 생성 함수
+    create_all()은 이미 존재하는 테이블의 인덱스를 추가하지 않으므로 인덱스별로 존재 여부를 확인하여 생성합니다.
+    인덱스 생성에 실패해도 서버 시작은 계속되며, 실패한 인덱스는 테이블/인덱스 이름과 함께 error 레벨로 기록됩니다.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(bind=engine, checkfirst=True)
+            except Exception as e:
+                logger.error(f"❌ 인덱스 생성 실패 ({table.name}.{index.name}): {e}")
+
+
 def test_connection() -> bool:
     """
     데이터베이스 연결 테스트 함수
@@ -220,7 +220,7 @@ CREATE TABLE "upbit_accounts" (
   "collected_at" timestamptz DEFAULT (now())
 );
 
-CREATE INDEX "idx_ticker_market_collected" ON "upbit_ticker" ("market", "collected_at");
+CREATE INDEX "idx_ticker_market_collected" ON "upbit_ticker" ("market", "collected_at" DESC);
 
 CREATE UNIQUE INDEX "ux_candle3_market_time" ON "upbit_candles_minute3" ("market", "candle_date_time_utc");
 
@@ -230,10 +230,16 @@ CREATE UNIQUE INDEX "ux_rsi_market_time_period_interval" ON "upbit_rsi" ("market
 
 CREATE UNIQUE INDEX "ux_indicators_market_time" ON "upbit_indicators" ("market", "candle_date_time_utc", "interval");
 
+CREATE INDEX "idx_indicators_market_interval_time" ON "upbit_indicators" ("market", "interval", "candle_date_time_utc" DESC);
+
+CREATE INDEX "idx_rsi_market_interval_period_time" ON "upbit_rsi" ("market", "interval", "period", "candle_date_time_utc" DESC);
+
 CREATE INDEX "idx_llm_prompt_generated" ON "llm_prompt_data" ("generated_at");
 
 CREATE UNIQUE INDEX "ux_accounts_account_currency" ON "upbit_accounts" ("account_id", "currency");
 
+CREATE INDEX "idx_accounts_account_currency_collected" ON "upbit_accounts" ("account_id", "currency", "collected_at" DESC) INCLUDE ("balance");
+
 CREATE INDEX "idx_execution_prompt_id" ON "llm_trading_execution" ("prompt_id");
 
 CREATE INDEX "idx_execution_account_id" ON "llm_trading_execution" ("account_id");
@@ -246,6 +252,20 @@ CREATE INDEX "idx_execution_account_id" ON "llm_trading_execution" ("account_id"
 
 CREATE INDEX "idx_execution_executed_at" ON "llm_trading_execution" ("executed_at");
 
+CREATE INDEX "idx_execution_account_executed_balance" ON "llm_trading_execution" ("account_id", "executed_at") INCLUDE ("balance_before", "balance_after", "coin", "signal_type", "execution_status") WHERE "balance_before" IS NOT NULL AND "balance_after" IS NOT NULL;
+
+CREATE INDEX "idx_execution_prompt_coin_status" ON "llm_trading_execution" ("prompt_id", "coin", "execution_status");
+
+CREATE INDEX "idx_signal_prompt_coin" ON "llm_trading_signal" ("prompt_id", "coin") INCLUDE ("stop_loss", "profit_target");
+
+CREATE INDEX "idx_account_info_user_created" ON "account_information" ("user_id", "created_at" DESC);
+
+CREATE INDEX "idx_execution_success_coin_executed" ON "llm_trading_execution" ("coin", "executed_at") INCLUDE ("account_id", "balance_before", "balance_after") WHERE "execution_status" = 'success';
+
+CREATE INDEX "idx_signal_stop_loss_account_coin" ON "llm_trading_signal" ("account_id", "coin") INCLUDE ("stop_loss", "prompt_id") WHERE "stop_loss" IS NOT NULL;
+
+CREATE INDEX "idx_signal_profit_target_account_coin" ON "llm_trading_signal" ("account_id", "coin") INCLUDE ("profit_target", "prompt_id") WHERE "profit_target" IS NOT NULL;
+
 COMMENT ON TABLE "upbit_markets" IS 'Upbit 거래가능 마켓 기본정보';
 
 COMMENT ON COLUMN "upbit_markets"."market" IS '마켓 코드 (예: KRW-BTC)';
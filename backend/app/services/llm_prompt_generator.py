@@ -5,10 +5,12 @@ LLM 프롬프트 생성 모듈
 
 import asyncio
 import logging
+import numpy as np
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, event, func
 
 from app.core.config import UpbitAPIConfig, IndicatorsConfig, LLMPromptConfig
 from app.db.database import (
@@ -48,30 +50,97 @@ def get_server_start_time() -> Optional[datetime]:
     return _server_start_time
 
 
-# 전역 서버 시작 시간 (서버 시작 시 설정됨)
-_server_start_time: Optional[datetime] = None
+# 코인 1개 데이터 수집(get_coin_data)에 허용되는 최대 쿼리 수
+# 현재가 1 + 3분봉 캔들/지표/RSI 3 + 일봉 캔들/지표/RSI 3 = 7
+# 이 값을 넘으면 N+1 조회가 새로 생긴 것이므로 경고를 남깁니다.
+_MAX_QUERIES_PER_COIN = 7
 
 
-def set_server_start_time(start_time: datetime) -> None:
+@contextmanager
+def _count_queries(db: Session):
     """
-    서버 시작 시간 설정 (전역 변수)
+    블록 안에서 세션이 실행한 ORM 쿼리 수를 세는 컨텍스트 매니저
     
-    Args:
-        start_time: 서버 시작 시각 (UTC)
+    Yields:
+        dict: {"count": 실행된 쿼리 수}
     """
-    global _server_start_time
-    _server_start_time = start_time
-    logger.info(f"서버 시작 시간 설정: {start_time}")
+    counter = {"count": 0}
+    
+    def _on_execute(orm_execute_state):
+        counter["count"] += 1
+    
+    event.listen(db, "do_orm_execute", _on_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(db, "do_orm_execute", _on_execute)
 
 
-def get_server_start_time() -> Optional[datetime]:
-    """
-    서버 시작 시간 조회
-    
-    Returns:
-        datetime | None: 서버 시작 시각 (UTC), 설정되지 않았으면 None
-    """
-    return _server_start_time
+# ==================== 프롬프트 템플릿 ====================
+# 매 주기 동일한 정적 문구는 모듈 로드 시 한 번만 만들고, 값만 format()으로 채웁니다.
+
+# 정적 프리앰블은 매 주기 완전히 동일하므로 프롬프트 맨 앞에 두어 vLLM의 자동 프리픽스 캐시에 적중시킵니다.
+# 거래 경과 시간처럼 매번 바뀌는 값은 반드시 프리앰블 뒤에 와야 합니다.
+_PROMPT_PREAMBLE = (
+    "Below, we are providing you with a variety of state data, price data, and predictive signals so you can discover alpha. "
+    "Below that is your current account information, value, performance, positions, etc.\n\n"
+    "**ALL OF THE PRICE OR SIGNAL DATA BELOW IS ORDERED: OLDEST → NEWEST**\n\n"
+    "**Timeframes note:** Unless stated otherwise in a section title, intraday series are provided at **3‑minute intervals**. "
+    "If a coin uses a different interval, it is explicitly stated in that coin's section.\n\n"
+)
+
+_PROMPT_INTRO_TEMPLATE = (
+    "It has been {trading_minutes} minute since you started trading.\n\n"
+    "---\n\n"
+    "### CURRENT MARKET STATE FOR ALL COINS\n\n"
+)
+
+_COIN_HEADER_TEMPLATE = (
+    "### ALL {coin_name} DATA\n\n"
+    "current_price = {current_price}, "
+    "current_ema20 = {current_ema20}, "
+    "current_macd = {current_macd}, "
+    "current_rsi (7 period) = {current_rsi7}\n\n"
+)
+
+_COIN_OPEN_INTEREST_TEMPLATE = (
+    "In addition, here is the latest {coin_name} open interest and funding rate for perps (the instrument you are trading):\n\n"
+    "Open Interest: Latest: {open_interest_latest}  "
+    "Average: {open_interest_avg}\n\n"
+    "Funding Rate: {funding_rate}\n\n"
+)
+
+_COIN_INTRADAY_TEMPLATE = (
+    "**Intraday series (by 3-minute, oldest → latest):**\n\n"
+    "Mid prices: {mid_prices}\n\n"
+    "EMA indicators (20‑period): {ema_indicators}\n\n"
+    "MACD indicators: {macd_indicators}\n\n"
+    "RSI indicators (7‑Period): {rsi_indicators_7}\n\n"
+    "RSI indicators (14‑Period): {rsi_indicators_14}\n\n"
+)
+
+_COIN_LONGER_TERM_TEMPLATE = (
+    "**Longer‑term context (1‑day timeframe):**\n\n"
+    "20‑Period EMA: {ema20} vs. "
+    "50‑Period EMA: {ema50}\n\n"
+    "3‑Period ATR: {atr3} vs. "
+    "14‑Period ATR: {atr14}\n\n"
+    "Current Volume: {current_volume} vs. "
+    "Average Volume: {avg_volume}\n\n"
+    "MACD indicators: {macd_indicators}\n\n"
+    "RSI indicators (14‑Period): {rsi_indicators_14}\n\n"
+    "---\n\n"
+)
+
+_ACCOUNT_TEMPLATE = (
+    "### HERE IS YOUR ACCOUNT INFORMATION & PERFORMANCE\n\n"
+    "Current Total Return (percent): {current_total_return_percent}%\n\n"
+    "Available Cash: {available_cash}\n\n"
+    "**Current Account Value:** {current_account_value}\n\n"
+    "Current live positions & performance:\n\n"
+    "{positions}\n\n"
+    "Sharpe Ratio: {sharpe_ratio}\n"
+)
 
 
 class LLMPromptGenerator:
@@ -97,21 +166,106 @@ class LLMPromptGenerator:
         else:
             self.trading_start_time = trading_start_time
 
-    def calculate_trading_minutes(self) -> int:
-        """거래 시작 후 경과 시간(분) 계산"""
-        elapsed = datetime.now(timezone.utc) - self.trading_start_time
+    def calculate_trading_minutes(self, now: Optional[datetime] = None) -> int:
+        """
+        거래 시작 후 경과 시간(분) 계산
+        
+        Args:
+            now: 기준 시각 (None이면 현재 시각, 반복 호출 시 한 번 구한 값을 넘겨 재사용)
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
+        elapsed = now - self.trading_start_time
         return int(elapsed.total_seconds() / 60)
     
-    def get_current_price(self, market: str) -> Optional[float]:
-        """현재가 조회"""
-        ticker = self.db.query(UpbitTicker).filter(
+    def get_latest_ticker_prices(self, markets: List[str]) -> Dict[str, float]:
+        """
+        여러 마켓의 최신 현재가를 한 번의 쿼리로 조회
+        마켓별 MAX(collected_at) 서브쿼리와 조인하여 마켓마다 최신 행만 가져옵니다.
+        
+        Args:
+            markets: 마켓 코드 리스트 (예: ["KRW-BTC", "KRW-ETH"])
+        
+        Returns:
+            Dict[str, float]: 마켓 코드 -> 현재가 (데이터가 없는 마켓은 제외)
+        """
+        latest = self.db.query(
+            UpbitTicker.market,
+            func.max(UpbitTicker.collected_at).label('max_collected_at')
+        ).filter(
+            UpbitTicker.market.in_(markets)
+        ).group_by(UpbitTicker.market).subquery()
+        
+        rows = self.db.query(UpbitTicker.market, UpbitTicker.trade_price).join(
+            latest,
+            (UpbitTicker.market == latest.c.market) &
+            (UpbitTicker.collected_at == latest.c.max_collected_at)
+        ).all()
+        
+        prices = {}
+        for market, trade_price in rows:
+            if trade_price:
+                prices[market] = float(trade_price)
+        return prices
+    
+    def get_current_price(self, market: str, ticker_prices: Optional[Dict[str, float]] = None) -> Optional[float]:
+        """
+        현재가 조회
+        
+        Args:
+            market: 마켓 코드
+            ticker_prices: get_latest_ticker_prices()로 미리 조회한 현재가 (있으면 쿼리 생략)
+        """
+        if ticker_prices is not None:
+            return ticker_prices.get(market)
+        
+        trade_price = self.db.query(UpbitTicker.trade_price).filter(
             UpbitTicker.market == market
-        ).order_by(desc(UpbitTicker.collected_at)).first()
+        ).order_by(desc(UpbitTicker.collected_at)).limit(1).scalar()
         
-        if ticker and ticker.trade_price:
-            return float(ticker.trade_price)
+        if trade_price:
+            return float(trade_price)
         return None
     
+    def _fetch_latest_ascending(self, query, time_column, limit: int) -> List:
+        """
+        최근 limit개 행을 오래된 것부터 정렬하여 조회
+        안쪽 쿼리에서 DESC + LIMIT으로 최신 행만 자르고 바깥 쿼리에서 ASC로 정렬하므로
+        결과를 파이썬에서 다시 뒤집을 필요가 없습니다.
+        
+        Args:
+            query: 조회 컬럼과 필터가 적용된 Query
+            time_column: 정렬 기준 시각 컬럼
+            limit: 조회할 최대 행 수
+        """
+        sub = query.order_by(desc(time_column)).limit(limit).subquery()
+        return self.db.query(sub).order_by(sub.c[time_column.key]).all()
+    
+    def get_indicator_rows(self, market: str, interval: str, limit: int) -> List:
+        """
+        upbit_indicators 테이블에서 최근 지표 행 조회
+        
+        Args:
+            market: 마켓 코드
+            interval: 지표 계산 주기 (minute3, day)
+            limit: 조회할 최대 행 수
+        
+        Returns:
+            List: candle_date_time_utc, macd, ema20, ema50, atr3, atr14 컬럼을 가진 행 (오래된 것부터 정렬)
+        """
+        query = self.db.query(
+            UpbitIndicators.candle_date_time_utc,
+            UpbitIndicators.macd,
+            UpbitIndicators.ema20,
+            UpbitIndicators.ema50,
+            UpbitIndicators.atr3,
+            UpbitIndicators.atr14
+        ).filter(
+            UpbitIndicators.market == market,
+            UpbitIndicators.interval == interval
+        )
+        return self._fetch_latest_ascending(query, UpbitIndicators.candle_date_time_utc, limit)
+    
     def get_intraday_series(self, market: str, count: int = 10) -> Dict:
         """
         3분봉 인트라데이 시리즈 데이터 조회
@@ -120,34 +274,32 @@ class LLMPromptGenerator:
         Returns:
             Dict: mid_prices, ema_indicators, macd_indicators, rsi_indicators_7, rsi_indicators_14
         """
-        # 최근 count개의 3분봉 캔들 조회
-        candles = self.db.query(UpbitCandlesMinute3).filter(
-            UpbitCandlesMinute3.market == market
-        ).order_by(desc(UpbitCandlesMinute3.candle_date_time_utc)).limit(count).all()
-        
-        candles = list(reversed(candles))  # 오래된 것부터 정렬
+        # 최근 count개의 3분봉 캔들 조회 (필요한 컬럼만, 오래된 것부터 정렬)
+        candles = self._fetch_latest_ascending(
+            self.db.query(
+                UpbitCandlesMinute3.candle_date_time_utc,
+                UpbitCandlesMinute3.high_price,
+                UpbitCandlesMinute3.low_price,
+                UpbitCandlesMinute3.trade_price
+            ).filter(UpbitCandlesMinute3.market == market),
+            UpbitCandlesMinute3.candle_date_time_utc,
+            count
+        )
+        # 캔들 시각 목록은 한 번만 추출해 RSI 조회에 재사용
+        candle_times = [c.candle_date_time_utc for c in candles]
         
         if len(candles) < count:
             logger.warning(f"⚠️ {market} 인트라데이 데이터 부족: {len(candles)}개 < {count}개 필요")
         
-        # Mid prices 계산 (고가+저가)/2
-        mid_prices = []
-        for candle in candles:
-            if candle.high_price and candle.low_price:
-                mid = (float(candle.high_price) + float(candle.low_price)) / 2
-                mid_prices.append(mid)
-            elif candle.trade_price:
-                mid_prices.append(float(candle.trade_price))
-            else:
-                mid_prices.append(0.0)
+        # Mid prices 계산 (고가+저가)/2, 고가/저가가 없으면 종가, 종가도 없으면 0 (NumPy 벡터 연산)
+        candle_count = len(candles)
+        highs = np.fromiter((float(c.high_price or 0) for c in candles), dtype=np.float64, count=candle_count)
+        lows = np.fromiter((float(c.low_price or 0) for c in candles), dtype=np.float64, count=candle_count)
+        trades = np.fromiter((float(c.trade_price or 0) for c in candles), dtype=np.float64, count=candle_count)
+        mid_prices = np.where((highs != 0) & (lows != 0), (highs + lows) * 0.5, trades).tolist()
         
         # upbit_indicators 테이블에서 저장된 지표 조회 (3분봉)
-        indicators_from_db = self.db.query(UpbitIndicators).filter(
-            UpbitIndicators.market == market,
-            UpbitIndicators.interval == 'minute3'
-        ).order_by(desc(UpbitIndicators.candle_date_time_utc)).limit(count).all()
-        
-        indicators_from_db = list(reversed(indicators_from_db))  # 오래된 것부터 정렬
+        indicators_from_db = self.get_indicator_rows(market, 'minute3', count)
         
         # MACD indicators: DB에서 조회 (최대 10개)
         MAX_INDICATOR_COUNT = 10
@@ -166,46 +318,30 @@ class LLMPromptGenerator:
                     ema_indicators.append(float(indicator.ema20))
         ema_indicators = ema_indicators[-MAX_INDICATOR_COUNT:]  # 최대 10개로 제한
         
-        # RSI(14): upbit_rsi 테이블에서 조회 (3분봉 캔들 시각과 일치하는 RSI만)
+        # RSI(7), RSI(14): upbit_rsi 테이블에서 한 번에 조회 (3분봉 캔들 시각과 일치하는 RSI만)
         # 3분봉 RSI는 3분봉 캔들 시각과 일치하는 데이터만 조회
-        rsi_indicators_14 = []
-        if candles:
-            # 3분봉 캔들 시각 목록 추출
-            candle_times = [candle.candle_date_time_utc for candle in candles]
-            
-            # 해당 시각들과 일치하는 RSI만 조회 (3분봉 RSI)
-            rsi_from_db_14 = self.db.query(UpbitRSI).filter(
-                UpbitRSI.market == market,
-                UpbitRSI.period == IndicatorsConfig.LLM_RSI_LONG_PERIOD,
-                UpbitRSI.interval == 'minute3',
-                UpbitRSI.candle_date_time_utc.in_(candle_times)
-            ).order_by(desc(UpbitRSI.candle_date_time_utc)).limit(count).all()
-            
-            rsi_from_db_14 = list(reversed(rsi_from_db_14))  # 오래된 것부터 정렬
-            for rsi in rsi_from_db_14:
-                if rsi.rsi is not None:
-                    rsi_indicators_14.append(float(rsi.rsi))
-            rsi_indicators_14 = rsi_indicators_14[-MAX_INDICATOR_COUNT:]  # 최대 10개로 제한
-        
-        # RSI(7): upbit_rsi 테이블에서 조회 (3분봉 캔들 시각과 일치하는 RSI만)
         rsi_indicators_7 = []
-        if candles:
-            # 3분봉 캔들 시각 목록 추출
-            candle_times = [candle.candle_date_time_utc for candle in candles]
-            
-            # 해당 시각들과 일치하는 RSI만 조회 (3분봉 RSI)
-            rsi_from_db_7 = self.db.query(UpbitRSI).filter(
+        rsi_indicators_14 = []
+        if candle_times:
+            # 해당 시각들과 일치하는 단기/장기 RSI를 하나의 쿼리로 조회 (오래된 것부터 정렬)
+            rsi_from_db = self.db.query(
+                UpbitRSI.candle_date_time_utc, UpbitRSI.period, UpbitRSI.rsi
+            ).filter(
                 UpbitRSI.market == market,
-                UpbitRSI.period == IndicatorsConfig.LLM_RSI_SHORT_PERIOD,
+                UpbitRSI.period.in_([IndicatorsConfig.LLM_RSI_SHORT_PERIOD, IndicatorsConfig.LLM_RSI_LONG_PERIOD]),
                 UpbitRSI.interval == 'minute3',
                 UpbitRSI.candle_date_time_utc.in_(candle_times)
-            ).order_by(desc(UpbitRSI.candle_date_time_utc)).limit(count).all()
+            ).order_by(UpbitRSI.candle_date_time_utc).all()
             
-            rsi_from_db_7 = list(reversed(rsi_from_db_7))  # 오래된 것부터 정렬
-            for rsi in rsi_from_db_7:
-                if rsi.rsi is not None:
+            for rsi in rsi_from_db:
+                if rsi.rsi is None:
+                    continue
+                if rsi.period == IndicatorsConfig.LLM_RSI_SHORT_PERIOD:
                     rsi_indicators_7.append(float(rsi.rsi))
+                elif rsi.period == IndicatorsConfig.LLM_RSI_LONG_PERIOD:
+                    rsi_indicators_14.append(float(rsi.rsi))
             rsi_indicators_7 = rsi_indicators_7[-MAX_INDICATOR_COUNT:]  # 최대 10개로 제한
+            rsi_indicators_14 = rsi_indicators_14[-MAX_INDICATOR_COUNT:]  # 최대 10개로 제한
         
         # Mid prices도 최대 10개로 제한
         mid_prices = mid_prices[-MAX_INDICATOR_COUNT:]
@@ -227,30 +363,29 @@ class LLMPromptGenerator:
             Dict: ema20, ema50, atr3, atr14, volume, avg_volume, macd_indicators, rsi_indicators_14
         """
         # 일봉 데이터를 4시간봉으로 간주 (근사치)
-        # 최근 50개 일봉 조회
-        day_candles = self.db.query(UpbitDayCandles).filter(
-            UpbitDayCandles.market == market
-        ).order_by(desc(UpbitDayCandles.candle_date_time_utc)).limit(50).all()
-        
-        day_candles = list(reversed(day_candles))  # 오래된 것부터 정렬
+        # 최근 50개 일봉 조회 (오래된 것부터 정렬)
+        day_candles = self._fetch_latest_ascending(
+            self.db.query(
+                UpbitDayCandles.candle_date_time_utc,
+                UpbitDayCandles.candle_acc_trade_volume
+            ).filter(UpbitDayCandles.market == market),
+            UpbitDayCandles.candle_date_time_utc,
+            50
+        )
+        # 일봉 캔들 시각 목록은 한 번만 추출해 RSI 조회에 재사용
+        day_candle_times = [c.candle_date_time_utc for c in day_candles]
         
         if len(day_candles) < 50:
             logger.warning(f"⚠️ {market} 장기 데이터 부족: {len(day_candles)}개 < 50개 필요")
         
-        volumes = []
-        for candle in day_candles:
-            if candle.candle_acc_trade_volume:
-                volumes.append(float(candle.candle_acc_trade_volume))
-            else:
-                volumes.append(0.0)
+        volumes = np.fromiter(
+            (float(c.candle_acc_trade_volume or 0) for c in day_candles),
+            dtype=np.float64,
+            count=len(day_candles)
+        )
         
         # upbit_indicators 테이블에서 저장된 지표 조회 (일봉)
-        indicators_from_db = self.db.query(UpbitIndicators).filter(
-            UpbitIndicators.market == market,
-            UpbitIndicators.interval == 'day'
-        ).order_by(desc(UpbitIndicators.candle_date_time_utc)).limit(50).all()
-        
-        indicators_from_db = list(reversed(indicators_from_db))  # 오래된 것부터 정렬
+        indicators_from_db = self.get_indicator_rows(market, 'day', 50)
         
         # ATR(14): DB에서 최신 값 조회
         atr14 = None
@@ -273,9 +408,9 @@ class LLMPromptGenerator:
             ema50 = float(indicators_from_db[-1].ema50)
         
         # Volume 및 Average Volume
-        if volumes:
-            current_volume = volumes[-1]
-            avg_volume = sum(volumes) / len(volumes)
+        if volumes.size:
+            current_volume = float(volumes[-1])
+            avg_volume = float(volumes.mean())
         else:
             current_volume = 0.0
             avg_volume = 0.0
@@ -292,19 +427,18 @@ class LLMPromptGenerator:
         # RSI(14) indicators (시리즈): upbit_rsi 테이블에서 조회 (일봉 캔들 시각과 일치하는 RSI만)
         # 일봉 RSI는 일봉 캔들 시각(자정)과 일치하는 데이터만 조회
         rsi_indicators_14 = []
-        if day_candles:
-            # 일봉 캔들 시각 목록 추출
-            day_candle_times = [candle.candle_date_time_utc for candle in day_candles]
-            
-            # 해당 시각들과 일치하는 RSI만 조회 (일봉 RSI)
-            rsi_from_db = self.db.query(UpbitRSI).filter(
-                UpbitRSI.market == market,
-                UpbitRSI.period == IndicatorsConfig.LLM_RSI_LONG_PERIOD,
-                UpbitRSI.interval == 'day',
-                UpbitRSI.candle_date_time_utc.in_(day_candle_times)
-            ).order_by(desc(UpbitRSI.candle_date_time_utc)).limit(MAX_INDICATOR_COUNT).all()
-            
-            rsi_from_db = list(reversed(rsi_from_db))  # 오래된 것부터 정렬
+        if day_candle_times:
+            # 해당 시각들과 일치하는 RSI만 조회 (일봉 RSI, 오래된 것부터 정렬)
+            rsi_from_db = self._fetch_latest_ascending(
+                self.db.query(UpbitRSI.candle_date_time_utc, UpbitRSI.rsi).filter(
+                    UpbitRSI.market == market,
+                    UpbitRSI.period == IndicatorsConfig.LLM_RSI_LONG_PERIOD,
+                    UpbitRSI.interval == 'day',
+                    UpbitRSI.candle_date_time_utc.in_(day_candle_times)
+                ),
+                UpbitRSI.candle_date_time_utc,
+                MAX_INDICATOR_COUNT
+            )
             for rsi in rsi_from_db:
                 if rsi.rsi is not None:
                     rsi_indicators_14.append(float(rsi.rsi))
@@ -321,7 +455,7 @@ class LLMPromptGenerator:
             'rsi_indicators_14': rsi_indicators_14
         }
     
-    def get_coin_data(self, market: str) -> Dict:
+    def get_coin_data(self, market: str, ticker_prices: Optional[Dict[str, float]] = None) -> Dict:
         """
         특정 코인의 모든 데이터 수집
         현재가, 기술 지표(EMA, MACD, RSI), 인트라데이 시리즈, 장기 컨텍스트 등을 조회합니다.
@@ -329,6 +463,7 @@ class LLMPromptGenerator:
         
         Args:
             market: 마켓 코드 (예: "KRW-BTC")
+            ticker_prices: 미리 조회한 마켓별 현재가 (None이면 개별 조회)
         
         Returns:
             Dict: 다음 키를 포함한 딕셔너리
@@ -343,38 +478,37 @@ class LLMPromptGenerator:
                 - open_interest_avg: 평균 미결제약정 (현재 None)
                 - funding_rate: 펀딩비 (현재 None, 외부 데이터 소스 필요)
         """
-        current_price = self.get_current_price(market)
-        
-        # 인트라데이 시리즈 조회 (DB 우선 사용)
         from app.core.config import ScriptConfig
-        intraday_series = self.get_intraday_series(market, count=ScriptConfig.DEFAULT_INTRADAY_SERIES_COUNT)
+        
+        with _count_queries(self.db) as query_counter:
+            current_price = self.get_current_price(market, ticker_prices)
+            
+            # 인트라데이 시리즈 조회 (DB 우선 사용)
+            intraday_series = self.get_intraday_series(market, count=ScriptConfig.DEFAULT_INTRADAY_SERIES_COUNT)
+            
+            # 장기 컨텍스트 조회 (DB 우선 사용)
+            longer_term = self.get_longer_term_context(market)
+        
+        if query_counter["count"] > _MAX_QUERIES_PER_COIN:
+            logger.warning(
+                f"⚠️ {market} 데이터 수집 쿼리 수 초과: {query_counter['count']}회 > {_MAX_QUERIES_PER_COIN}회 (N+1 조회 확인 필요)"
+            )
         
         # 현재 지표 값 (인트라데이 시리즈의 최신 값 사용)
         current_ema20 = None
         if intraday_series['ema_indicators']:
             current_ema20 = intraday_series['ema_indicators'][-1]
         
-        # MACD: DB에서 최신 값 조회 시도
+        # MACD: 인트라데이 시리즈의 최신 값 사용 (시리즈가 비어 있으면 DB에도 값이 없음)
         current_macd = None
         if intraday_series['macd_indicators']:
             current_macd = intraday_series['macd_indicators'][-1]
-        else:
-            # DB에 없으면 최신 지표에서 조회
-            latest_indicator = self.db.query(UpbitIndicators).filter(
-                UpbitIndicators.market == market,
-                UpbitIndicators.interval == 'minute3'
-            ).order_by(desc(UpbitIndicators.candle_date_time_utc)).first()
-            if latest_indicator and latest_indicator.macd is not None:
-                current_macd = float(latest_indicator.macd)
         
         # RSI(7): 인트라데이 시리즈에서 최신 값 사용
         current_rsi7 = None
         if intraday_series['rsi_indicators_7']:
             current_rsi7 = intraday_series['rsi_indicators_7'][-1]
         
-        # 장기 컨텍스트 조회 (DB 우선 사용)
-        longer_term = self.get_longer_term_context(market)
-        
         # Open Interest 및 Funding Rate는 Upbit에서 제공하지 않으므로 None으로 설정
         # (실제로는 다른 데이터 소스가 필요)
         open_interest_latest = None
@@ -394,11 +528,14 @@ class LLMPromptGenerator:
             'funding_rate': funding_rate
         }
     
-    def get_account_data(self) -> Dict:
+    def get_account_data(self, ticker_prices: Optional[Dict[str, float]] = None) -> Dict:
         """
         계정 정보 및 성과 데이터 조회
         DB에서 실제 계정 데이터를 조회하여 현금 잔액, 포지션 정보, 손익 등을 계산합니다.
         
+        Args:
+            ticker_prices: 미리 조회한 마켓별 현재가 (None이면 한 번의 쿼리로 조회)
+        
         Returns:
             Dict: 다음 키를 포함한 딕셔너리
                 - current_total_return_percent: 현재 총 수익률 (%, 초기 가치 기준 필요)
@@ -414,8 +551,12 @@ class LLMPromptGenerator:
         from app.db.database import UpbitTicker
         from app.core.config import UpbitAPIConfig
         
-        # 최신 계정 데이터 조회
-        accounts = self.db.query(UpbitAccounts).order_by(
+        # 최신 계정 데이터 조회 (잔액 계산에 필요한 컬럼만 조회)
+        accounts = self.db.query(
+            UpbitAccounts.currency,
+            UpbitAccounts.balance,
+            UpbitAccounts.avg_buy_price
+        ).order_by(
             desc(UpbitAccounts.collected_at)
         ).all()
         
@@ -426,16 +567,14 @@ class LLMPromptGenerator:
                 available_cash = float(account.balance)
                 break
         
-        # 각 코인의 현재가 조회
-        ticker_prices = {}
-        for market in UpbitAPIConfig.MAIN_MARKETS:
-            ticker = self.db.query(UpbitTicker).filter(
-                UpbitTicker.market == market
-            ).order_by(desc(UpbitTicker.collected_at)).first()
-            
-            if ticker and ticker.trade_price:
-                currency = market.split("-")[1] if "-" in market else market
-                ticker_prices[currency] = float(ticker.trade_price)
+        # 각 코인의 현재가 조회 (모든 마켓을 한 번의 쿼리로 조회)
+        if ticker_prices is None:
+            ticker_prices = self.get_latest_ticker_prices(UpbitAPIConfig.MAIN_MARKETS)
+        
+        coin_prices = {}
+        for market, price in ticker_prices.items():
+            currency = market.split("-")[1] if "-" in market else market
+            coin_prices[currency] = price
         
         # 포지션 정보 수집 (코인 보유량)
         positions = []
@@ -457,7 +596,7 @@ class LLMPromptGenerator:
             
             balance = float(account.balance) if account.balance else 0.0
             avg_buy_price = float(account.avg_buy_price) if account.avg_buy_price else 0.0
-            current_price = ticker_prices.get(currency, 0.0)
+            current_price = coin_prices.get(currency, 0.0)
             
             if balance > 0:
                 # 손익 계산
@@ -494,6 +633,101 @@ class LLMPromptGenerator:
             'sharpe_ratio': sharpe_ratio
         }
     
+    @staticmethod
+    def render_coin_section(market: str, coin_data: Dict) -> str:
+        """
+        코인 1개의 프롬프트 섹션 텍스트 생성
+        마켓 데이터를 수집하는 즉시 섹션을 만들 수 있도록 코인 단위로 분리되어 있습니다.
+        
+        Args:
+            market: 마켓 코드 (예: "KRW-BTC")
+            coin_data: get_coin_data() 결과
+        
+        Returns:
+            str: 코인 섹션 텍스트 (데이터가 없으면 빈 문자열)
+        """
+        if not coin_data:
+            return ""
+        
+        if '-' in market:
+            coin_name = market.split('-')[1]
+        else:
+            coin_name = market
+        
+        parts: List[str] = [_COIN_HEADER_TEMPLATE.format(
+            coin_name=coin_name,
+            current_price=coin_data.get('current_price', 'N/A'),
+            current_ema20=coin_data.get('current_ema20', 'N/A'),
+            current_macd=coin_data.get('current_macd', 'N/A'),
+            current_rsi7=coin_data.get('current_rsi7', 'N/A')
+        )]
+        
+        # Open Interest 및 Funding Rate
+        if coin_data.get('open_interest_latest') is not None:
+            parts.append(_COIN_OPEN_INTEREST_TEMPLATE.format(
+                coin_name=coin_name,
+                open_interest_latest=coin_data.get('open_interest_latest', 'N/A'),
+                open_interest_avg=coin_data.get('open_interest_avg', 'N/A'),
+                funding_rate=coin_data.get('funding_rate', 'N/A')
+            ))
+        
+        # Intraday series
+        intraday = coin_data.get('intraday_series', {})
+        parts.append(_COIN_INTRADAY_TEMPLATE.format(
+            mid_prices=intraday.get('mid_prices', []),
+            ema_indicators=intraday.get('ema_indicators', []),
+            macd_indicators=intraday.get('macd_indicators', []),
+            rsi_indicators_7=intraday.get('rsi_indicators_7', []),
+            rsi_indicators_14=intraday.get('rsi_indicators_14', [])
+        ))
+        
+        # Longer-term context
+        longer_term = coin_data.get('longer_term_context', {})
+        parts.append(_COIN_LONGER_TERM_TEMPLATE.format(
+            ema20=longer_term.get('ema20', 'N/A'),
+            ema50=longer_term.get('ema50', 'N/A'),
+            atr3=longer_term.get('atr3', 'N/A'),
+            atr14=longer_term.get('atr14', 'N/A'),
+            current_volume=longer_term.get('current_volume', 'N/A'),
+            avg_volume=longer_term.get('avg_volume', 'N/A'),
+            macd_indicators=longer_term.get('macd_indicators', []),
+            rsi_indicators_14=longer_term.get('rsi_indicators_14', [])
+        ))
+        
+        return "".join(parts)
+    
+    @staticmethod
+    def build_prompt_text(coin_sections: Iterable[str], account_data: Dict, trading_minutes: int) -> str:
+        """
+        렌더링된 코인 섹션들로 프롬프트 텍스트 생성
+        
+        Args:
+            coin_sections: render_coin_section() 결과 (마켓 순서대로, 제너레이터 가능)
+            account_data: 계정 데이터 JSON
+            trading_minutes: 거래 시작 후 경과 시간 (분)
+        
+        Returns:
+            str: 생성된 프롬프트 텍스트
+        """
+        # 문자열 += 누적 대신 조각을 모아 마지막에 한 번만 합침
+        # 정적 프리앰블 → 경과 시간 → 코인 섹션 → 계정 정보 순서 (앞부분 프리픽스 캐시 유지)
+        parts: List[str] = [
+            _PROMPT_PREAMBLE,
+            _PROMPT_INTRO_TEMPLATE.format(trading_minutes=trading_minutes),
+        ]
+        parts.extend(coin_sections)
+        
+        # Account information
+        parts.append(_ACCOUNT_TEMPLATE.format(
+            current_total_return_percent=account_data.get('current_total_return_percent', 0),
+            available_cash=account_data.get('available_cash', 0),
+            current_account_value=account_data.get('current_account_value', 0),
+            positions=account_data.get('positions', []),
+            sharpe_ratio=account_data.get('sharpe_ratio', 0)
+        ))
+        
+        return "".join(parts)
+    
     @staticmethod
     def generate_prompt_text_from_data(market_data: Dict, account_data: Dict, trading_minutes: int) -> str:
         """
@@ -510,72 +744,69 @@ class LLMPromptGenerator:
         """
         from app.core.config import UpbitAPIConfig
         
-        prompt = f"It has been {trading_minutes} minute since you started trading.\n\n"
-        prompt += "…\n\n"
-        prompt += "Below, we are providing you with a variety of state data, price data, and predictive signals so you can discover alpha. "
-        prompt += "Below that is your current account information, value, performance, positions, etc.\n\n"
-        prompt += "**ALL OF THE PRICE OR SIGNAL DATA BELOW IS ORDERED: OLDEST → NEWEST**\n\n"
-        prompt += "**Timeframes note:** Unless stated otherwise in a section title, intraday series are provided at **3‑minute intervals**. "
-        prompt += "If a coin uses a different interval, it is explicitly stated in that coin's section.\n\n"
-        prompt += "---\n\n"
-        prompt += "### CURRENT MARKET STATE FOR ALL COINS\n\n"
-        
-        # 각 코인 데이터 추가
-        for market in UpbitAPIConfig.MAIN_MARKETS:
-            coin_data = market_data.get(market, {})
-            if not coin_data:
-                continue
-            
-            if '-' in market:
-                coin_name = market.split('-')[1]
-            else:
-                coin_name = market
-            
-            prompt += f"### ALL {coin_name} DATA\n\n"
-            prompt += f"current_price = {coin_data.get('current_price', 'N/A')}, "
-            prompt += f"current_ema20 = {coin_data.get('current_ema20', 'N/A')}, "
-            prompt += f"current_macd = {coin_data.get('current_macd', 'N/A')}, "
-            prompt += f"current_rsi (7 period) = {coin_data.get('current_rsi7', 'N/A')}\n\n"
-            
-            # Open Interest 및 Funding Rate
-            if coin_data.get('open_interest_latest') is not None:
-                prompt += f"In addition, here is the latest {coin_name} open interest and funding rate for perps (the instrument you are trading):\n\n"
-                prompt += f"Open Interest: Latest: {coin_data.get('open_interest_latest', 'N/A')}  "
-                prompt += f"Average: {coin_data.get('open_interest_avg', 'N/A')}\n\n"
-                prompt += f"Funding Rate: {coin_data.get('funding_rate', 'N/A')}\n\n"
-            
-            # Intraday series
-            intraday = coin_data.get('intraday_series', {})
-            prompt += "**Intraday series (by 3-minute, oldest → latest):**\n\n"
-            prompt += f"Mid prices: {intraday.get('mid_prices', [])}\n\n"
-            prompt += f"EMA indicators (20‑period): {intraday.get('ema_indicators', [])}\n\n"
-            prompt += f"MACD indicators: {intraday.get('macd_indicators', [])}\n\n"
-            prompt += f"RSI indicators (7‑Period): {intraday.get('rsi_indicators_7', [])}\n\n"
-            prompt += f"RSI indicators (14‑Period): {intraday.get('rsi_indicators_14', [])}\n\n"
-            
-            # Longer-term context
-            longer_term = coin_data.get('longer_term_context', {})
-            prompt += "**Longer‑term context (1‑day timeframe):**\n\n"
-            prompt += f"20‑Period EMA: {longer_term.get('ema20', 'N/A')} vs. "
-            prompt += f"50‑Period EMA: {longer_term.get('ema50', 'N/A')}\n\n"
-            prompt += f"3‑Period ATR: {longer_term.get('atr3', 'N/A')} vs. "
-            prompt += f"14‑Period ATR: {longer_term.get('atr14', 'N/A')}\n\n"
-            prompt += f"Current Volume: {longer_term.get('current_volume', 'N/A')} vs. "
-            prompt += f"Average Volume: {longer_term.get('avg_volume', 'N/A')}\n\n"
-            prompt += f"MACD indicators: {longer_term.get('macd_indicators', [])}\n\n"
-            prompt += f"RSI indicators (14‑Period): {longer_term.get('rsi_indicators_14', [])}\n\n"
-            prompt += "---\n\n"
+        coin_sections = (
+            LLMPromptGenerator.render_coin_section(market, market_data.get(market, {}))
+            for market in UpbitAPIConfig.MAIN_MARKETS
+        )
+        return LLMPromptGenerator.build_prompt_text(coin_sections, account_data, trading_minutes)
+    
+    def save_prompt_data(
+        self,
+        market_data: Dict,
+        ticker_prices: Dict[str, float],
+        coin_sections: List[str]
+    ) -> LLMPromptData:
+        """
+        수집한 시장 데이터로 프롬프트를 생성하여 llm_prompt_data 테이블에 저장
+        계정 데이터 조회, 지표 설정 수집, 프롬프트 텍스트 생성, 저장을 수행합니다.
+        예외는 호출자(generate_and_save / generate_and_save_async)가 처리합니다.
         
-        # Account information
-        prompt += "### HERE IS YOUR ACCOUNT INFORMATION & PERFORMANCE\n\n"
-        prompt += f"Current Total Return (percent): {account_data.get('current_total_return_percent', 0)}%\n\n"
-        prompt += f"Available Cash: {account_data.get('available_cash', 0)}\n\n"
-        prompt += f"**Current Account Value:** {account_data.get('current_account_value', 0)}\n\n"
-        prompt += "Current live positions & performance:\n\n"
-        prompt += f"{account_data.get('positions', [])}\n\n"
-        prompt += f"Sharpe Ratio: {account_data.get('sharpe_ratio', 0)}\n"
-        
-        return prompt
+        Args:
+            market_data: 마켓 코드 -> get_coin_data() 결과
+            ticker_prices: get_latest_ticker_prices()로 조회한 마켓별 현재가
+            coin_sections: 마켓 데이터 수집 시점에 미리 렌더링한 코인 섹션 텍스트 (마켓 순서대로)
+        
+        Returns:
+            LLMPromptData: 저장된 LLMPromptData 객체
+        """
+        # 계정 데이터 수집 (DB에서 조회)
+        account_data = self.get_account_data(ticker_prices)
+        
+        # 지표 설정 정보
+        indicator_config = {
+            'ema_period': IndicatorsConfig.LLM_EMA_PERIOD,
+            'ema_long_period': IndicatorsConfig.LLM_EMA_LONG_PERIOD,
+            'macd_fast_period': IndicatorsConfig.LLM_MACD_FAST_PERIOD,
+            'macd_slow_period': IndicatorsConfig.LLM_MACD_SLOW_PERIOD,
+            'rsi_short_period': IndicatorsConfig.LLM_RSI_SHORT_PERIOD,
+            'rsi_long_period': IndicatorsConfig.LLM_RSI_LONG_PERIOD,
+            'atr_short_period': IndicatorsConfig.LLM_ATR_SHORT_PERIOD,
+            'atr_long_period': IndicatorsConfig.LLM_ATR_LONG_PERIOD
+        }
+        
+        # 거래 경과 시간 계산 (생성 시각과 같은 기준 시각 사용)
+        now = datetime.now(timezone.utc)
+        trading_minutes = self.calculate_trading_minutes(now)
+        
+        # 프롬프트 텍스트 생성 (미리 렌더링한 코인 섹션 재사용)
+        prompt_text = self.build_prompt_text(coin_sections, account_data, trading_minutes)
+        
+        # 데이터베이스에 저장 (프롬프트 텍스트 포함)
+        prompt_data = LLMPromptData(
+            generated_at=now,
+            trading_minutes=trading_minutes,
+            prompt_text=prompt_text,
+            market_data_json=market_data,
+            account_data_json=account_data,
+            indicator_config_json=indicator_config
+        )
+        
+        self.db.add(prompt_data)
+        self.db.commit()
+        
+        logger.info(f"✅ LLM 프롬프트 데이터 저장 완료 (거래 시작 후 {trading_minutes}분, 프롬프트 텍스트 포함)")
+        
+        return prompt_data
     
     def generate_and_save(self) -> Optional[LLMPromptData]:
         """
@@ -594,53 +825,51 @@ class LLMPromptGenerator:
             6. 데이터베이스에 저장 (프롬프트 텍스트 포함)
         """
         try:
-            # 시장 데이터 수집 (DB에서 조회)
+            # 모든 마켓의 현재가를 한 번에 조회 (시장/계정 데이터에서 공유)
+            ticker_prices = self.get_latest_ticker_prices(UpbitAPIConfig.MAIN_MARKETS)
+            
+            # 시장 데이터 수집 (DB에서 조회, 마켓별로 조회 즉시 프롬프트 섹션 렌더링)
             market_data = {}
+            coin_sections = []
             for market in UpbitAPIConfig.MAIN_MARKETS:
-                coin_data = self.get_coin_data(market)
+                coin_data = self.get_coin_data(market, ticker_prices)
                 market_data[market] = coin_data
+                coin_sections.append(self.render_coin_section(market, coin_data))
             
-            # 계정 데이터 수집 (DB에서 조회)
-            account_data = self.get_account_data()
-            
-            # 지표 설정 정보
-            indicator_config = {
-                'ema_period': IndicatorsConfig.LLM_EMA_PERIOD,
-                'ema_long_period': IndicatorsConfig.LLM_EMA_LONG_PERIOD,
-                'macd_fast_period': IndicatorsConfig.LLM_MACD_FAST_PERIOD,
-                'macd_slow_period': IndicatorsConfig.LLM_MACD_SLOW_PERIOD,
-                'rsi_short_period': IndicatorsConfig.LLM_RSI_SHORT_PERIOD,
-                'rsi_long_period': IndicatorsConfig.LLM_RSI_LONG_PERIOD,
-                'atr_short_period': IndicatorsConfig.LLM_ATR_SHORT_PERIOD,
-                'atr_long_period': IndicatorsConfig.LLM_ATR_LONG_PERIOD
-            }
-            
-            # 거래 경과 시간 계산
-            trading_minutes = self.calculate_trading_minutes()
+            return self.save_prompt_data(market_data, ticker_prices, coin_sections)
+        
+        except Exception as e:
+            logger.error(f"❌ LLM 프롬프트 데이터 저장 오류: {e}")
+            self.db.rollback()
+            return None
+    
+    async def generate_and_save_async(self) -> Optional[LLMPromptData]:
+        """
+        generate_and_save()의 비동기 버전
+        마켓별 데이터 조회를 스레드 풀에서 동시에 실행하여 (마켓별 별도 세션 사용)
+        전체 소요 시간을 마켓 수의 합이 아닌 가장 느린 마켓 기준으로 줄이고,
+        이벤트 루프를 블로킹하지 않습니다.
+        
+        Returns:
+            Optional[LLMPromptData]: 저장된 LLMPromptData 객체 또는 None (실패 시)
+        """
+        loop = asyncio.get_running_loop()
+        markets = UpbitAPIConfig.MAIN_MARKETS
+        try:
+            # 모든 마켓의 현재가를 한 번에 조회 (시장/계정 데이터에서 공유)
+            ticker_prices = await loop.run_in_executor(None, self.get_latest_ticker_prices, markets)
             
-            # 프롬프트 텍스트 생성
-            prompt_text = self.generate_prompt_text_from_data(
-                market_data=market_data,
-                account_data=account_data,
-                trading_minutes=trading_minutes
-            )
+            # 시장 데이터 수집 (마켓별 병렬 조회, 각 스레드에서 프롬프트 섹션까지 렌더링)
+            results = await asyncio.gather(*(
+                loop.run_in_executor(None, _collect_coin_data, market, ticker_prices, self.trading_start_time)
+                for market in markets
+            ))
+            market_data = {market: coin_data for market, (coin_data, _) in zip(markets, results)}
+            coin_sections = [section for _, section in results]
             
-            # 데이터베이스에 저장 (프롬프트 텍스트 포함)
-            prompt_data = LLMPromptData(
-                generated_at=datetime.now(timezone.utc),
-                trading_minutes=trading_minutes,
-                prompt_text=prompt_text,
-                market_data_json=market_data,
-                account_data_json=account_data,
-                indicator_config_json=indicator_config
+            return await loop.run_in_executor(
+                None, self.save_prompt_data, market_data, ticker_prices, coin_sections
             )
-            
-            self.db.add(prompt_data)
-            self.db.commit()
-            
-            logger.info(f"✅ LLM 프롬프트 데이터 저장 완료 (거래 시작 후 {trading_minutes}분, 프롬프트 텍스트 포함)")
-            
-            return prompt_data
         
         except Exception as e:
             logger.error(f"❌ LLM 프롬프트 데이터 저장 오류: {e}")
@@ -648,11 +877,28 @@ class LLMPromptGenerator:
             return None
 
 
+def _collect_coin_data(market: str, ticker_prices: Dict[str, float], trading_start_time: datetime) -> tuple:
+    """
+    별도 DB 세션으로 단일 마켓 데이터 수집 및 프롬프트 섹션 렌더링 (스레드 풀 병렬 실행용)
+    세션은 스레드 간에 공유할 수 없으므로 호출마다 새 세션을 열고 닫습니다.
+    
+    Returns:
+        tuple: (get_coin_data() 결과, render_coin_section() 결과)
+    """
+    db = SessionLocal()
+    try:
+        coin_data = LLMPromptGenerator(db, trading_start_time).get_coin_data(market, ticker_prices)
+    finally:
+        db.close()
+    return coin_data, LLMPromptGenerator.render_coin_section(market, coin_data)
+
+
 async def generate_prompt_data_periodically():
     """
     LLM 프롬프트 데이터 주기적 생성 (정3분 기준)
     정3분마다 모든 마켓의 데이터를 조회하여 llm_prompt_data 테이블에 저장합니다.
     서버 시작 시 즉시 실행하지 않고 다음 정3분까지 대기합니다.
+    매 주기마다 세션을 새로 열고 주기가 끝나면 닫아, 대기 중에 트랜잭션이 열린 채 남지 않게 합니다.
     """
     while True:
         try:
@@ -665,7 +911,7 @@ async def generate_prompt_data_periodically():
             db = SessionLocal()
             try:
                 generator = LLMPromptGenerator(db)
-                prompt_data = generator.generate_and_save()
+                prompt_data = await generator.generate_and_save_async()
                 
                 if prompt_data:
                     logger.info(f"✅ LLM 프롬프트 데이터 주기적 저장 완료 (ID: {prompt_data.id}, 거래 경과: {prompt_data.trading_minutes}분, 정3분 기준)")
@@ -679,4 +925,4 @@ async def generate_prompt_data_periodically():
             break
         except Exception as e:
             logger.error(f"❌ LLM 프롬프트 데이터 주기적 생성 오류: {e}")
-            await asyncio.sleep(60)  # 오류 발생 시 1분 대기 후 재시도
\ No newline at end of file
+            await asyncio.sleep(60)  # 오류 발생 시 1분 대기 후 재시도
@@ -4,11 +4,15 @@ LLM이 생성한 거래 신호의 유효성을 검증하고 재요청을 처리
 """
 
 import logging
+import time
 from datetime import datetime
 from decimal import Decimal
-from typing import Tuple, List, Optional
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Dict, Tuple, List, Optional
 from uuid import UUID
 
+from sqlalchemy import bindparam, func, insert, select
 from sqlalchemy.orm import Session
 
 from app.schemas.llm import TradeDecision
@@ -18,18 +22,192 @@ from app.db.database import (
     LLMTradingExecution,
     LLMTradingSignal
 )
+from app.services.statistics_service import invalidate_statistics_cache
 
 logger = logging.getLogger(__name__)
 
 # 허용되는 신호 타입
 VALID_SIGNAL_TYPES = {"buy_to_enter", "sell_to_exit", "hold", "close_position", "buy", "sell", "exit"}
 
+# 오류 메시지용 정렬된 신호 타입 목록 (한 번만 정렬)
+_VALID_SIGNAL_TYPES_SORTED = sorted(VALID_SIGNAL_TYPES)
+
 # 매수 신호
 BUY_SIGNALS = {"buy", "buy_to_enter"}
 
 # 매도 신호
 SELL_SIGNALS = {"sell", "sell_to_exit", "close_position", "exit"}
 
+# 신호 타입 -> 카테고리("buy" / "sell" / "hold") 조회 테이블
+_SIGNAL_CATEGORY: Dict[str, str] = (
+    {signal: "buy" for signal in BUY_SIGNALS}
+    | {signal: "sell" for signal in SELL_SIGNALS}
+    | {"hold": "hold"}
+)
+
+# 재요청 프롬프트 템플릿 (모듈 로드 시 한 번만 생성)
+_RETRY_PROMPT_TEMPLATE = (
+    "\n"
+    "[재요청] 이전 응답이 다음 이유로 거부되었습니다:\n\n"
+    "{rejection_text}\n\n"
+    "**중요 규칙:**\n"
+    "1. signal 값은 반드시 다음 중 하나여야 합니다: buy_to_enter, sell_to_exit, hold, close_position\n"
+    "2. quantity는 필수이며 0보다 커야 합니다 (hold 신호 제외)\n"
+    "3. quantity는 계좌 잔액을 초과할 수 없습니다\n\n"
+    "이전 응답:\n"
+    "- signal: {signal}\n"
+    "- coin: {coin}\n"
+    "- quantity: {quantity}\n"
+    "- confidence: {confidence}\n\n"
+    "위의 오류를 수정하여 올바른 JSON 응답을 생성해주세요.\n\n"
+    "원본 프롬프트:\n"
+    "{original_prompt}\n"
+)
+
+# 최신 현재가/잔액 단기 캐시 (짧은 시간 안에 반복되는 검증의 DB 조회 생략)
+# 값: (만료 시각(time.monotonic 기준), 조회 값)
+TICKER_CACHE_TTL_SECONDS = 3
+BALANCE_CACHE_TTL_SECONDS = 10
+_CACHE_MAX_SIZE = 512
+_ticker_price_cache: Dict[str, Tuple[float, Optional[Decimal]]] = {}
+_balance_cache: Dict[Tuple[str, str], Tuple[float, Optional[Decimal]]] = {}
+# 최근 잔액 초과로 거부된 결정 캐시 (LLM 재요청이 같은 결정을 반복할 때 잔액 조회 생략)
+# 키: (계정 ID, 코인, 신호 카테고리, 수량), 값: (만료 시각, (거부 사유, 검증 시 잔액))
+# 매수 거부는 현재가에도 의존하므로 현재가 캐시와 같은 TTL 사용
+REJECT_CACHE_TTL_SECONDS = TICKER_CACHE_TTL_SECONDS
+_reject_cache: Dict[Tuple[str, str, str, Decimal], Tuple[float, Tuple[str, Decimal]]] = {}
+_cache_lock = Lock()
+
+
+@lru_cache(maxsize=256)
+def _krw_market(coin: str) -> str:
+    """코인 심볼의 KRW 마켓 코드 (예: "BTC" -> "KRW-BTC"), 반복되는 코인은 같은 문자열 재사용"""
+    return f"KRW-{coin}"
+
+
+def _to_decimal(value) -> Decimal:
+    """
+    숫자 값을 Decimal로 변환
+    DB Numeric 컬럼 값은 이미 Decimal이므로 그대로 사용하고, 정수는 바로 변환합니다.
+    float은 이진 표현 오차가 그대로 옮겨지지 않도록 문자열을 거쳐 변환합니다.
+    """
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, int):
+        return Decimal(value)
+    return Decimal(str(value))
+
+
+def _cache_get(cache: Dict, key) -> Tuple[bool, Any]:
+    """캐시 조회 (만료된 항목은 없는 것으로 처리), (적중 여부, 값) 반환"""
+    with _cache_lock:
+        entry = cache.get(key)
+    if entry is None or entry[0] <= time.monotonic():
+        return False, None
+    return True, entry[1]
+
+
+def _cache_set(cache: Dict, key, value: Any, ttl: float) -> None:
+    """캐시 저장 (최대 크기 초과 시 만료 항목 정리, 그래도 크면 전체 비움)"""
+    now = time.monotonic()
+    with _cache_lock:
+        if len(cache) >= _CACHE_MAX_SIZE:
+            for expired_key in [k for k, (expires_at, _) in cache.items() if expires_at <= now]:
+                del cache[expired_key]
+            if len(cache) >= _CACHE_MAX_SIZE:
+                cache.clear()
+        cache[key] = (now + ttl, value)
+
+
+def invalidate_balance_cache(account_id: str, currency: Optional[str] = None) -> None:
+    """
+    잔액 캐시 무효화 (주문 체결로 잔액이 바뀐 뒤 호출)
+    잔액에 근거한 해당 계정의 거부 결정 캐시도 함께 비웁니다.
+    
+    Args:
+        account_id: 계정 ID (문자열)
+        currency: 무효화할 통화, None이면 해당 계정의 모든 통화
+    """
+    with _cache_lock:
+        for key in [k for k in _reject_cache if k[0] == account_id]:
+            del _reject_cache[key]
+        if currency is not None:
+            _balance_cache.pop((account_id, currency), None)
+            return
+        for key in [k for k in _balance_cache if k[0] == account_id]:
+            del _balance_cache[key]
+
+
+# 최신 현재가/잔액 조회 문 (모듈 로드 시 한 번만 구성하고, 호출마다 파라미터만 바꿔 실행)
+_LATEST_PRICE_SUBQUERY = (
+    select(UpbitTicker.trade_price)
+    .where(UpbitTicker.market == bindparam("market"))
+    .order_by(UpbitTicker.collected_at.desc())
+    .limit(1)
+    .scalar_subquery()
+)
+_LATEST_BALANCE_SUBQUERY = (
+    select(UpbitAccounts.balance)
+    .where(
+        UpbitAccounts.account_id == bindparam("account_id"),
+        UpbitAccounts.currency == bindparam("currency")
+    )
+    .order_by(UpbitAccounts.collected_at.desc())
+    .limit(1)
+    .scalar_subquery()
+)
+_LATEST_PRICE_AND_BALANCE_STMT = select(_LATEST_PRICE_SUBQUERY, _LATEST_BALANCE_SUBQUERY)
+_LATEST_PRICE_STMT = select(_LATEST_PRICE_SUBQUERY)
+_LATEST_BALANCE_STMT = select(_LATEST_BALANCE_SUBQUERY)
+
+
+def _get_latest_price_and_balance(
+    db: Session,
+    account_id_str: str,
+    currency: str,
+    market: Optional[str] = None
+) -> Tuple[Optional[Decimal], Optional[Decimal]]:
+    """
+    최신 현재가와 최신 잔액을 한 번의 쿼리로 조회
+    각 값은 collected_at 최신 1건을 고르는 스칼라 서브쿼리로 만들어 하나의 SELECT로 묶습니다.
+    (현재가와 잔액이 DB 왕복 1회로 함께 조회되므로 두 조회를 따로 병렬 실행할 필요가 없습니다.)
+    단기 캐시에 있는 값은 쿼리에서 제외하고, 둘 다 캐시에 있으면 DB를 조회하지 않습니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        account_id_str: 계정 ID (문자열)
+        currency: 잔액을 조회할 통화 (예: "KRW", "BTC")
+        market: 현재가를 조회할 마켓 코드 (예: "KRW-BTC"), None이면 현재가는 조회하지 않음
+    
+    Returns:
+        Tuple[Optional[Decimal], Optional[Decimal]]: (현재가, 잔액), 데이터가 없으면 None
+    """
+    balance_key = (account_id_str, currency)
+    balance_cached, balance = _cache_get(_balance_cache, balance_key)
+    price_cached, trade_price = (True, None) if market is None else _cache_get(_ticker_price_cache, market)
+    
+    if balance_cached and price_cached:
+        return trade_price, balance
+    
+    if price_cached:
+        balance = db.execute(
+            _LATEST_BALANCE_STMT, {"account_id": account_id_str, "currency": currency}
+        ).scalar()
+    elif balance_cached:
+        trade_price = db.execute(_LATEST_PRICE_STMT, {"market": market}).scalar()
+    else:
+        trade_price, balance = db.execute(
+            _LATEST_PRICE_AND_BALANCE_STMT,
+            {"market": market, "account_id": account_id_str, "currency": currency}
+        ).one()
+    
+    if not price_cached:
+        _cache_set(_ticker_price_cache, market, trade_price, TICKER_CACHE_TTL_SECONDS)
+    if not balance_cached:
+        _cache_set(_balance_cache, balance_key, balance, BALANCE_CACHE_TTL_SECONDS)
+    
+    return trade_price, balance
+
 
 def _save_validation_failure(
     db: Session,
@@ -49,29 +227,30 @@ def _save_validation_failure(
 ) -> None:
     """
     검증 실패 기록을 llm_trading_execution 테이블에 저장
+    ORM 객체 없이 INSERT 문만 실행하며, 커밋은 호출자가 트랜잭션 단위로 한 번 수행합니다.
+    INSERT는 SAVEPOINT 안에서 실행하므로 실패해도 이 기록만 취소되고,
+    같은 트랜잭션에 먼저 추가된 실패 기록이나 호출자의 작업은 유지됩니다.
     """
     try:
-        execution = LLMTradingExecution(
-            prompt_id=prompt_id,
-            account_id=account_id,
-            coin=coin,
-            signal_type=signal_type,
-            execution_status=execution_status,
-            failure_reason=failure_reason,
-            intended_price=intended_price,
-            executed_price=executed_price,
-            intended_quantity=intended_quantity,
-            executed_quantity=executed_quantity,
-            balance_before=balance_before,
-            balance_after=balance_after,
-            signal_created_at=signal_created_at
-        )
-        db.add(execution)
-        db.commit()
-        logger.info(f"✅ 검증 실패 기록 저장 완료 (prompt_id={prompt_id}, reason={failure_reason})")
+        with db.begin_nested():
+            db.execute(insert(LLMTradingExecution).values(
+                prompt_id=prompt_id,
+                account_id=account_id,
+                coin=coin,
+                signal_type=signal_type,
+                execution_status=execution_status,
+                failure_reason=failure_reason,
+                intended_price=intended_price,
+                executed_price=executed_price,
+                intended_quantity=intended_quantity,
+                executed_quantity=executed_quantity,
+                balance_before=balance_before,
+                balance_after=balance_after,
+                signal_created_at=signal_created_at
+            ))
+        logger.info("✅ 검증 실패 기록 저장 완료 (prompt_id=%s, reason=%s)", prompt_id, failure_reason)
     except Exception as e:
-        logger.error(f"❌ 검증 실패 기록 저장 실패: {e}", exc_info=True)
-        db.rollback()
+        logger.error("❌ 검증 실패 기록 저장 실패: %s", e, exc_info=True)
 
 
 def validate_trade_decision(
@@ -79,7 +258,8 @@ def validate_trade_decision(
     account_id: Optional[UUID],
     db: Session,
     prompt_id: Optional[int] = None,
-    signal_created_at: Optional[datetime] = None
+    signal_created_at: Optional[datetime] = None,
+    commit: bool = True
 ) -> Tuple[bool, List[str]]:
     """
     LLM 거래 신호 검증
@@ -88,41 +268,36 @@ def validate_trade_decision(
     1. 필수 필드 존재 여부 (signal, quantity, coin)
     2. signal 타입 유효성 검증
     3. 계좌 잔액 대비 quantity 검증
+    
+    commit=False이면 검증 실패 기록을 트랜잭션에만 추가하고 커밋은 호출자가 수행합니다.
     """
     errors: List[str] = []
+    # 실패 기록에 남길 잔액 검증 값 (잔액 초과로 실패한 경우에만 채워짐)
+    failed_quantity: Optional[Decimal] = None
+    failed_balance_before: Optional[Decimal] = None
+    
+    # 정규화 (이후 검증은 모두 정규화된 값 사용)
+    coin = decision.coin.upper() if decision.coin else ""
+    signal_type = decision.signal.lower().strip() if decision.signal else ""
     
     # -----------------------------
     # 1. 필수 필드 검증
     # -----------------------------
-    if not decision.coin or not decision.coin.strip():
+    if not coin.strip():
         errors.append("coin 필드값 누락")
     
-    if not decision.signal or not decision.signal.strip():
+    if not signal_type:
         errors.append("signal 필드값 누락")
     
-    if decision.signal and decision.signal.lower().strip() != "hold":
+    if decision.signal and signal_type != "hold":
         if decision.quantity is None:
             errors.append("quantity 필드값 누락")
         elif decision.quantity <= 0:
             errors.append(f"quantity가 0 이하입니다. (값: {decision.quantity})")
     
-    # 정규화
-    coin = decision.coin.upper() if decision.coin else ""
-    signal_type = decision.signal.lower().strip() if decision.signal else ""
-    
-    # 필수 필드 검증 실패 시 DB 저장
-    if errors:
-        if prompt_id:
-            _save_validation_failure(
-                db=db,
-                prompt_id=prompt_id,
-                account_id=account_id,
-                coin=coin,
-                signal_type=signal_type,
-                execution_status="failed",
-                failure_reason=", ".join(errors),
-                signal_created_at=signal_created_at
-            )
+    # hold 신호는 수량/잔액 검증이 필요 없으므로 필수 필드만 통과하면 바로 반환
+    if signal_type == "hold" and not errors:
+        return True, []
     
     # -----------------------------
     # 2. signal 타입 유효성 검증
@@ -130,59 +305,41 @@ def validate_trade_decision(
     if signal_type and signal_type not in VALID_SIGNAL_TYPES:
         error_msg = (
             f"알 수 없는 signal_type: '{signal_type}'. "
-            f"허용된 값: {sorted(VALID_SIGNAL_TYPES)}"
+            f"허용된 값: {_VALID_SIGNAL_TYPES_SORTED}"
         )
         errors.append(error_msg)
-        
-        if prompt_id:
-            _save_validation_failure(
-                db=db,
-                prompt_id=prompt_id,
-                account_id=account_id,
-                coin=coin,
-                signal_type=signal_type,
-                execution_status="failed",
-                failure_reason=error_msg,
-                signal_created_at=signal_created_at
-            )
     
-    # 신호 타입 플래그
-    is_buy_signal = signal_type in BUY_SIGNALS
-    is_sell_signal = signal_type in SELL_SIGNALS
-    is_hold_signal = (signal_type == "hold")
+    # 신호 카테고리
+    signal_category = _SIGNAL_CATEGORY.get(signal_type, "unknown")
     
     # -----------------------------
     # 3. 계좌 잔액 초과 검증
     # -----------------------------
-    if account_id and decision.quantity and decision.quantity > 0 and not is_hold_signal:
+    if account_id and decision.quantity and decision.quantity > 0 and signal_category != "hold":
         try:
             account_id_str = str(account_id)
-            quantity = Decimal(str(decision.quantity))
+            quantity = _to_decimal(decision.quantity)
+            reject_key = (account_id_str, coin, signal_category, quantity)
+            reject_cached, rejection = _cache_get(_reject_cache, reject_key)
+            
+            # 최근 같은 결정이 거부되었으면 잔액 조회 없이 같은 사유로 거부
+            if reject_cached:
+                error_msg, failed_balance_before = rejection
+                errors.append(error_msg)
+                failed_quantity = quantity
             
             # 매수 신호
-            if is_buy_signal:
-                ticker = (
-                    db.query(UpbitTicker)
-                    .filter(UpbitTicker.market == f"KRW-{coin}")
-                    .order_by(UpbitTicker.collected_at.desc())
-                    .first()
+            elif signal_category == "buy":
+                # 현재가와 KRW 잔액을 한 번에 조회
+                trade_price, krw_balance_value = _get_latest_price_and_balance(
+                    db, account_id_str, "KRW", market=_krw_market(coin)
                 )
                 
-                if ticker and ticker.trade_price:
-                    current_price = Decimal(str(ticker.trade_price))
+                if trade_price:
+                    current_price = _to_decimal(trade_price)
                     
-                    krw_account = (
-                        db.query(UpbitAccounts)
-                        .filter(
-                            UpbitAccounts.account_id == account_id_str,
-                            UpbitAccounts.currency == "KRW"
-                        )
-                        .order_by(UpbitAccounts.collected_at.desc())
-                        .first()
-                    )
-                    
-                    if krw_account and krw_account.balance is not None:
-                        krw_balance = Decimal(str(krw_account.balance))
+                    if krw_balance_value is not None:
+                        krw_balance = _to_decimal(krw_balance_value)
                         estimated_cost = quantity * current_price
                         
                         if estimated_cost > krw_balance:
@@ -192,35 +349,16 @@ def validate_trade_decision(
                                 f"보유: {krw_balance:,.2f} KRW"
                             )
                             errors.append(error_msg)
-                            
-                            if prompt_id:
-                                _save_validation_failure(
-                                    db=db,
-                                    prompt_id=prompt_id,
-                                    account_id=account_id,
-                                    coin=coin,
-                                    signal_type=signal_type,
-                                    execution_status="failed",
-                                    failure_reason=error_msg,
-                                    intended_quantity=quantity,
-                                    balance_before=krw_balance,
-                                    signal_created_at=signal_created_at
-                                )
+                            failed_quantity = quantity
+                            failed_balance_before = krw_balance
+                            _cache_set(_reject_cache, reject_key, (error_msg, krw_balance), REJECT_CACHE_TTL_SECONDS)
             
             # 매도 신호
-            elif is_sell_signal:
-                coin_account = (
-                    db.query(UpbitAccounts)
-                    .filter(
-                        UpbitAccounts.account_id == account_id_str,
-                        UpbitAccounts.currency == coin
-                    )
-                    .order_by(UpbitAccounts.collected_at.desc())
-                    .first()
-                )
+            elif signal_category == "sell":
+                _, coin_balance_value = _get_latest_price_and_balance(db, account_id_str, coin)
                 
-                if coin_account and coin_account.balance is not None:
-                    coin_balance = Decimal(str(coin_account.balance))
+                if coin_balance_value is not None:
+                    coin_balance = _to_decimal(coin_balance_value)
                     
                     if quantity > coin_balance:
                         error_msg = (
@@ -228,29 +366,159 @@ def validate_trade_decision(
                             f"의도: {quantity}, 보유: {coin_balance} {coin}"
                         )
                         errors.append(error_msg)
-                        
-                        if prompt_id:
-                            _save_validation_failure(
-                                db=db,
-                                prompt_id=prompt_id,
-                                account_id=account_id,
-                                coin=coin,
-                                signal_type=signal_type,
-                                execution_status="failed",
-                                failure_reason=error_msg,
-                                intended_quantity=quantity,
-                                balance_before=coin_balance,
-                                signal_created_at=signal_created_at
-                            )
+                        failed_quantity = quantity
+                        failed_balance_before = coin_balance
+                        _cache_set(_reject_cache, reject_key, (error_msg, coin_balance), REJECT_CACHE_TTL_SECONDS)
         
         except Exception as e:
-            logger.error(f"⚠️ 잔액 검증 중 예외 발생: {e}", exc_info=True)
+            logger.error("⚠️ 잔액 검증 중 예외 발생: %s", e, exc_info=True)
+    
+    # 검증 실패 시 모든 사유를 모아 한 번만 DB 저장
+    if errors and prompt_id:
+        _save_validation_failure(
+            db=db,
+            prompt_id=prompt_id,
+            account_id=account_id,
+            coin=coin,
+            signal_type=signal_type,
+            execution_status="failed",
+            failure_reason=", ".join(errors),
+            intended_quantity=failed_quantity,
+            balance_before=failed_balance_before,
+            signal_created_at=signal_created_at
+        )
+        if commit:
+            try:
+                db.commit()
+            except Exception as e:
+                logger.error("❌ 검증 실패 기록 커밋 실패: %s", e, exc_info=True)
+                db.rollback()
     
     # 최종 검증 결과 반환
     is_valid = len(errors) == 0
     return is_valid, errors
 
 
+def _prefetch_prices_and_balances(
+    db: Session,
+    decisions: List[TradeDecision],
+    account_id_str: str
+) -> None:
+    """
+    여러 결정에 필요한 최신 현재가와 잔액을 한 번씩만 조회하여 단기 캐시에 저장
+    마켓별/통화별 MAX(collected_at) 서브쿼리와 조인하여 최신 행만 가져오며,
+    데이터가 없는 마켓/통화는 None으로 저장해 결정별 검증에서 다시 조회하지 않게 합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        decisions: 검증할 거래 결정 목록
+        account_id_str: 계정 ID (문자열)
+    """
+    markets = set()
+    currencies = set()
+    for decision in decisions:
+        if not decision.coin or not decision.signal:
+            continue
+        coin = decision.coin.upper()
+        signal_category = _SIGNAL_CATEGORY.get(decision.signal.lower().strip())
+        if signal_category == "buy":
+            markets.add(_krw_market(coin))
+            currencies.add("KRW")
+        elif signal_category == "sell":
+            currencies.add(coin)
+    
+    if markets:
+        latest_ticker = (
+            select(UpbitTicker.market, func.max(UpbitTicker.collected_at).label("max_collected_at"))
+            .where(UpbitTicker.market.in_(markets))
+            .group_by(UpbitTicker.market)
+            .subquery()
+        )
+        prices = dict(db.execute(
+            select(UpbitTicker.market, UpbitTicker.trade_price).join(
+                latest_ticker,
+                (UpbitTicker.market == latest_ticker.c.market)
+                & (UpbitTicker.collected_at == latest_ticker.c.max_collected_at)
+            )
+        ).all())
+        for market in markets:
+            _cache_set(_ticker_price_cache, market, prices.get(market), TICKER_CACHE_TTL_SECONDS)
+    
+    if currencies:
+        latest_account = (
+            select(UpbitAccounts.currency, func.max(UpbitAccounts.collected_at).label("max_collected_at"))
+            .where(
+                UpbitAccounts.account_id == account_id_str,
+                UpbitAccounts.currency.in_(currencies)
+            )
+            .group_by(UpbitAccounts.currency)
+            .subquery()
+        )
+        balances = dict(db.execute(
+            select(UpbitAccounts.currency, UpbitAccounts.balance).join(
+                latest_account,
+                (UpbitAccounts.currency == latest_account.c.currency)
+                & (UpbitAccounts.collected_at == latest_account.c.max_collected_at)
+            ).where(UpbitAccounts.account_id == account_id_str)
+        ).all())
+        for currency in currencies:
+            _cache_set(
+                _balance_cache, (account_id_str, currency), balances.get(currency), BALANCE_CACHE_TTL_SECONDS
+            )
+
+
+def validate_trade_decisions(
+    decisions: List[TradeDecision],
+    account_id: Optional[UUID],
+    db: Session,
+    prompt_id: Optional[int] = None,
+    signal_created_at: Optional[datetime] = None
+) -> List[Tuple[bool, List[str]]]:
+    """
+    여러 LLM 거래 신호를 한 번에 검증
+    필요한 현재가(마켓별)와 잔액(통화별)을 각각 한 번의 쿼리로 미리 조회한 뒤
+    결정별 검증(validate_trade_decision)을 수행하므로, 결정 수와 관계없이 조회는 최대 2회입니다.
+    검증 실패 기록은 모든 결정을 검증한 뒤 한 번에 커밋합니다.
+    
+    Args:
+        decisions: 검증할 거래 결정 목록
+        account_id: 계정 ID
+        db: 데이터베이스 세션
+        prompt_id: 프롬프트 ID (있으면 검증 실패 기록 저장)
+        signal_created_at: 신호 생성 시각
+    
+    Returns:
+        List[Tuple[bool, List[str]]]: 결정 순서대로 (검증 통과 여부, 오류 목록)
+    """
+    if account_id:
+        try:
+            _prefetch_prices_and_balances(db, decisions, str(account_id))
+        except Exception as e:
+            # 미리 조회에 실패해도 결정별 검증에서 개별 조회로 진행
+            logger.error("⚠️ 현재가/잔액 일괄 조회 중 예외 발생: %s", e, exc_info=True)
+    
+    results = [
+        validate_trade_decision(
+            decision,
+            account_id,
+            db,
+            prompt_id=prompt_id,
+            signal_created_at=signal_created_at,
+            commit=False
+        )
+        for decision in decisions
+    ]
+    
+    if prompt_id and any(not is_valid for is_valid, _ in results):
+        try:
+            db.commit()
+        except Exception as e:
+            logger.error("❌ 검증 실패 기록 커밋 실패: %s", e, exc_info=True)
+            db.rollback()
+    
+    return results
+
+
 def build_retry_prompt(
     original_prompt: str,
     rejection_reasons: List[str],
@@ -269,29 +537,16 @@ def build_retry_prompt(
     """
     logger.info("📝 재요청 프롬프트 생성 중...")
     
-    rejection_text = "\n".join([f"- {reason}" for reason in rejection_reasons])
+    rejection_text = "\n".join("- " + reason for reason in rejection_reasons)
     
-    retry_prompt = f"""
-[재요청] 이전 응답이 다음 이유로 거부되었습니다:
-
-{rejection_text}
-
-**중요 규칙:**
-1. signal 값은 반드시 다음 중 하나여야 합니다: buy_to_enter, sell_to_exit, hold, close_position
-2. quantity는 필수이며 0보다 커야 합니다 (hold 신호 제외)
-3. quantity는 계좌 잔액을 초과할 수 없습니다
-
-이전 응답:
-- signal: {original_decision.signal}
-- coin: {original_decision.coin}
-- quantity: {original_decision.quantity}
-- confidence: {original_decision.confidence}
-
-위의 오류를 수정하여 올바른 JSON 응답을 생성해주세요.
-
-원본 프롬프트:
-{original_prompt}
-"""
+    retry_prompt = _RETRY_PROMPT_TEMPLATE.format(
+        rejection_text=rejection_text,
+        signal=original_decision.signal,
+        coin=original_decision.coin,
+        quantity=original_decision.quantity,
+        confidence=original_decision.confidence,
+        original_prompt=original_prompt
+    )
     
     logger.info("✅ 재요청 프롬프트 생성 완료")
     return retry_prompt
@@ -325,22 +580,11 @@ def validate_execution_result(
     errors: List[str] = []
     execution_status: Optional[str] = None
     
-    # 신호 카테고리 판별 함수
-    def _signal_category(sig: str) -> str:
-        sig = sig.lower()
-        if sig in BUY_SIGNALS:
-            return "buy"
-        if sig in SELL_SIGNALS:
-            return "sell"
-        if sig == "hold":
-            return "hold"
-        return "unknown"
-    
     # -----------------------------
     # (1) 매수/매도/hold 방향 불일치
     # -----------------------------
-    intended_dir = _signal_category(signal_type)
-    actual_dir = _signal_category(actual_signal_type)
+    intended_dir = _SIGNAL_CATEGORY.get(signal_type.lower(), "unknown")
+    actual_dir = _SIGNAL_CATEGORY.get(actual_signal_type.lower(), "unknown")
     
     if intended_dir != "unknown" and actual_dir != "unknown" and intended_dir != actual_dir:
         errors.append(
@@ -351,8 +595,7 @@ def validate_execution_result(
     # (2) 수량 불일치
     # -----------------------------
     if intended_quantity is not None and executed_quantity is not None and executed_quantity >= 0:
-        diff = abs(executed_quantity - intended_quantity)
-        if diff > Decimal("0"):
+        if executed_quantity != intended_quantity:
             errors.append(
                 f"의도한 수량({intended_quantity})과 실제 체결 수량({executed_quantity})이 다릅니다."
             )
@@ -422,6 +665,12 @@ def validate_execution_result(
     
     db.add(execution_row)
     db.commit()
-    db.refresh(execution_row)
+    invalidate_statistics_cache()
+    # id는 flush 시점에 채워지므로 서버 기본값 컬럼(executed_at)만 다시 조회
+    db.refresh(execution_row, ["executed_at"])
+    
+    # 체결로 잔액이 바뀌었으므로 해당 계정의 잔액 캐시 무효화
+    if account_id and execution_status == "success" and intended_dir != "hold":
+        invalidate_balance_cache(str(account_id))
     
     return execution_row
@@ -15,19 +15,68 @@ LLM 거래 신호를 기반으로 가상의 주문을 체결하고 upbit_account
 """
 
 import logging
-from datetime import datetime, timezone
-from typing import Optional
-from decimal import Decimal
-from uuid import UUID
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from decimal import Decimal, ROUND_HALF_UP
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import bindparam, desc, func, insert, select
 
 from app.db.database import UpbitAccounts, UpbitTicker, LLMTradingSignal
 from app.core.config import UpbitAPIConfig, OrderExecutionConfig
+from app.services.llm_response_validator import invalidate_balance_cache
 
 logger = logging.getLogger(__name__)
 
+# upbit_accounts 수량/가격 컬럼(Numeric(30, 10))의 소수 자릿수
+_ACCOUNT_VALUE_SCALE = Decimal("0.0000000001")
 
+
+# 체결을 지원하는 마켓 (멤버십 검사용)
+_SUPPORTED_MARKETS = frozenset(UpbitAPIConfig.MAIN_MARKETS)
+
+# execute_signal_orders에서 한 번에 읽어 오는 signal 수
+SIGNAL_FETCH_BATCH_SIZE = 200
+
+# 체결 계산에 필요한 upbit_accounts 컬럼 (행은 이 컬럼들의 dict로 다룸)
+_ACCOUNT_ROW_COLUMNS = (
+    UpbitAccounts.account_id,
+    UpbitAccounts.currency,
+    UpbitAccounts.balance,
+    UpbitAccounts.locked,
+    UpbitAccounts.avg_buy_price,
+    UpbitAccounts.avg_buy_price_modified,
+    UpbitAccounts.unit_currency,
+)
+
+
+# 최신 현재가/계정 행 조회 문 (모듈 로드 시 한 번만 구성하고, 호출마다 파라미터만 바꿔 실행)
+_LATEST_TICKER_PRICE_STMT = (
+    select(UpbitTicker.trade_price)
+    .where(UpbitTicker.market == bindparam("market"))
+    .order_by(UpbitTicker.collected_at.desc())
+    .limit(1)
+)
+_LATEST_ACCOUNT_STMT = (
+    select(*_ACCOUNT_ROW_COLUMNS)
+    .where(
+        UpbitAccounts.account_id == bindparam("account_id"),
+        UpbitAccounts.currency == bindparam("currency")
+    )
+    .order_by(UpbitAccounts.collected_at.desc())
+    .limit(1)
+)
+
+
+def _quantize_account_value(value: Decimal) -> Decimal:
+    """
+    DB에 저장되는 값과 같도록 소수 10자리로 반올림
+    (배치 내에서 account_map에 남는 행이 재조회한 값과 일치하도록)
+    """
+    return value.quantize(_ACCOUNT_VALUE_SCALE, rounding=ROUND_HALF_UP)
+
+
+@lru_cache(maxsize=8)
 def get_account_id_from_user_id(user_id: int) -> str:
     """
     userId를 account_id로 변환
@@ -42,6 +91,7 @@ def get_account_id_from_user_id(user_id: int) -> str:
     return f"00000000-0000-0000-0000-{user_id:012d}"
 
 
+@lru_cache(maxsize=8)
 def get_user_id_from_account_id(account_id: str) -> Optional[int]:
     """
     account_id를 userId로 변환
@@ -56,17 +106,21 @@ def get_user_id_from_account_id(account_id: str) -> Optional[int]:
     try:
         if not account_id:
             return None
-        # UUID의 마지막 부분에서 숫자 추출
-        last_part = str(account_id).split('-')[-1]
+        if not isinstance(account_id, str):
+            account_id = str(account_id)
+        # UUID의 마지막 부분(고정 12자리)에서 숫자 추출
+        last_part = account_id[-12:]
+        if len(last_part) != 12 or not last_part.isdigit():
+            return None
         user_id = int(last_part)
         if 1 <= user_id <= 4:
             return user_id
         return None
-    except (ValueError, AttributeError):
+    except ValueError:
         return None
 
 
-def get_current_price(db: Session, coin: str) -> Optional[float]:
+def get_current_price(db: Session, coin: str) -> Optional[Decimal]:
     """
     코인의 현재가 조회
     
@@ -75,24 +129,135 @@ def get_current_price(db: Session, coin: str) -> Optional[float]:
         coin: 코인 심볼 (예: BTC, ETH)
     
     Returns:
-        Optional[float]: 현재가 또는 None
+        Optional[Decimal]: 현재가 또는 None
     """
     market = f"KRW-{coin}"
-    if market not in UpbitAPIConfig.MAIN_MARKETS:
+    if market not in _SUPPORTED_MARKETS:
         logger.warning(f"⚠️ {market}은(는) 지원하지 않는 마켓입니다")
         return None
     
-    ticker = db.query(UpbitTicker).filter(
-        UpbitTicker.market == market
-    ).order_by(desc(UpbitTicker.collected_at)).first()
+    trade_price = db.execute(_LATEST_TICKER_PRICE_STMT, {"market": market}).scalar()
+    return trade_price or None
+
+
+def get_current_prices(db: Session, coins: Iterable[str]) -> Dict[str, Decimal]:
+    """
+    여러 코인의 현재가를 한 번의 쿼리로 조회
+    마켓별 MAX(collected_at) 서브쿼리와 조인하여 마켓마다 최신 행만 가져옵니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        coins: 코인 심볼 목록 (예: BTC, ETH)
+    
+    Returns:
+        Dict[str, Decimal]: 코인 심볼 -> 현재가 (지원하지 않거나 데이터가 없는 코인은 제외)
+    """
+    markets = set()
+    for coin in coins:
+        market = f"KRW-{coin}"
+        if market not in _SUPPORTED_MARKETS:
+            logger.warning(f"⚠️ {market}은(는) 지원하지 않는 마켓입니다")
+            continue
+        markets.add(market)
+    
+    if not markets:
+        return {}
+    
+    latest = db.query(
+        UpbitTicker.market,
+        func.max(UpbitTicker.collected_at).label('max_collected_at')
+    ).filter(
+        UpbitTicker.market.in_(markets)
+    ).group_by(UpbitTicker.market).subquery()
+    
+    rows = db.query(UpbitTicker.market, UpbitTicker.trade_price).join(
+        latest,
+        (UpbitTicker.market == latest.c.market) &
+        (UpbitTicker.collected_at == latest.c.max_collected_at)
+    ).all()
+    
+    prices = {}
+    for market, trade_price in rows:
+        if trade_price:
+            prices[market[len("KRW-"):]] = trade_price
+    return prices
+
+
+def get_latest_accounts(
+    db: Session,
+    pairs: Set[Tuple[str, str]]
+) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """
+    여러 (account_id, currency) 쌍의 최신 계정 행을 한 번의 쿼리로 조회
+    (account_id, currency)별 MAX(collected_at) 서브쿼리와 조인하여 최신 행만 가져옵니다.
+    
+    Args:
+        db: 데이터베이스 세션
+        pairs: (account_id 문자열, currency) 쌍 목록
+    
+    Returns:
+        Dict[Tuple[str, str], Dict[str, Any]]: (account_id, currency) -> 최신 계정 행 dict (없는 쌍은 제외)
+    """
+    if not pairs:
+        return {}
+    
+    account_ids = {account_id for account_id, _ in pairs}
+    currencies = {currency for _, currency in pairs}
     
-    if ticker and ticker.trade_price:
-        return float(ticker.trade_price)
+    latest = db.query(
+        UpbitAccounts.account_id,
+        UpbitAccounts.currency,
+        func.max(UpbitAccounts.collected_at).label('max_collected_at')
+    ).filter(
+        UpbitAccounts.account_id.in_(account_ids),
+        UpbitAccounts.currency.in_(currencies)
+    ).group_by(UpbitAccounts.account_id, UpbitAccounts.currency).subquery()
     
-    return None
+    rows = db.query(UpbitAccounts.id, *_ACCOUNT_ROW_COLUMNS).join(
+        latest,
+        (UpbitAccounts.account_id == latest.c.account_id) &
+        (UpbitAccounts.currency == latest.c.currency) &
+        (UpbitAccounts.collected_at == latest.c.max_collected_at)
+    ).all()
+    
+    accounts = {}
+    for row in rows:
+        key = (str(row.account_id), row.currency)
+        if key not in pairs:
+            continue
+        # 같은 시각의 행이 여러 개면 id가 큰(나중에 저장된) 행 사용
+        existing = accounts.get(key)
+        if existing is None or row.id > existing["id"]:
+            accounts[key] = row._asdict()
+    return accounts
 
 
-def execute_order(db: Session, signal: LLMTradingSignal) -> bool:
+def _get_latest_account(
+    db: Session,
+    account_id: str,
+    currency: str,
+    account_map: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    계정의 최신 행을 dict로 조회 (일괄 조회한 account_map이 있으면 재사용)
+    """
+    if account_map is not None:
+        return account_map.get((str(account_id), currency))
+    
+    row = db.execute(
+        _LATEST_ACCOUNT_STMT, {"account_id": account_id, "currency": currency}
+    ).first()
+    return row._asdict() if row else None
+
+
+def execute_order(
+    db: Session,
+    signal: LLMTradingSignal,
+    price_map: Optional[Dict[str, Decimal]] = None,
+    account_map: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = None,
+    pending_rows: Optional[List[Dict[str, Any]]] = None,
+    now: Optional[datetime] = None
+) -> bool:
     """
     주문 체결 실행
     LLM 거래 신호를 기반으로 가상의 주문을 체결하고 upbit_accounts를 업데이트합니다.
@@ -100,6 +265,10 @@ def execute_order(db: Session, signal: LLMTradingSignal) -> bool:
     Args:
         db: 데이터베이스 세션
         signal: LLM 거래 신호
+        price_map: get_current_prices()로 미리 조회한 코인별 현재가 (있으면 현재가 쿼리 생략)
+        account_map: get_latest_accounts()로 미리 조회한 최신 계정 행 (체결 시 새 행으로 갱신됨)
+        pending_rows: 주어지면 새 계정 행을 바로 저장하지 않고 여기에 모음 (호출자가 일괄 INSERT 후 커밋)
+        now: 새 계정 행의 collected_at (None이면 현재 시각)
     
     Returns:
         bool: 체결 성공 여부
@@ -109,87 +278,42 @@ def execute_order(db: Session, signal: LLMTradingSignal) -> bool:
         coin = signal.coin.upper()
         signal_type = signal.signal.lower()
         
-        # 현재가 조회
-        current_price = get_current_price(db, coin)
-        if not current_price:
-            logger.error(f"❌ {coin} 현재가 조회 실패")
-            return False
-        
-        # buy_to_enter: KRW에서 코인으로 변환
-        if signal_type == "buy_to_enter":
-            # 수량 계산
-            quantity = None
-            if signal.quantity and signal.quantity > 0:
-                quantity = float(signal.quantity)
-            elif signal.risk_usd and signal.risk_usd > 0:
-                # risk_usd 기반으로 수량 계산 (KRW 기준)
-                quantity = float(signal.risk_usd) / current_price
-            else:
-                logger.warning(f"⚠️ {account_id} {coin} {signal_type}: 수량 정보가 없습니다")
-                return False
-            
-            if quantity <= 0:
-                logger.warning(f"⚠️ {account_id} {coin} {signal_type}: 수량이 0 이하입니다")
-                return False
-            
-            return _execute_buy_order(db, account_id, coin, quantity, current_price)
-        
-        # sell_to_exit: 코인에서 KRW로 변환 (일부 판매)
-        elif signal_type == "sell_to_exit":
-            # 수량 계산
-            quantity = None
-            if signal.quantity and signal.quantity > 0:
-                quantity = float(signal.quantity)
-            elif signal.risk_usd and signal.risk_usd > 0:
-                # risk_usd 기반으로 수량 계산 (KRW 기준)
-                quantity = float(signal.risk_usd) / current_price
-            else:
-                logger.warning(f"⚠️ {account_id} {coin} {signal_type}: 수량 정보가 없습니다")
-                return False
-            
-            if quantity <= 0:
-                logger.warning(f"⚠️ {account_id} {coin} {signal_type}: 수량이 0 이하입니다")
-                return False
-            
-            return _execute_sell_order(db, account_id, coin, quantity, current_price)
-        
-        # close_position: 포지션 종료 (전부 판매)
-        elif signal_type == "close_position":
-            # 보유한 코인 잔액을 전부 조회
-            coin_account = db.query(UpbitAccounts).filter(
-                UpbitAccounts.account_id == account_id,
-                UpbitAccounts.currency == f"KRW-{coin}"
-            ).order_by(desc(UpbitAccounts.collected_at)).first()
-            
-            if not coin_account:
-                logger.error(f"❌ {account_id} {coin} 계정을 찾을 수 없습니다")
-                return False
-            
-            current_coin_balance = float(coin_account.balance) if coin_account.balance else 0.0
-            
-            if current_coin_balance <= 0:
-                logger.warning(f"⚠️ {account_id} {coin} {signal_type}: 보유 코인이 없습니다 (잔액: {current_coin_balance})")
-                return False
-            
-            # 보유한 코인을 전부 매도
-            logger.info(f"ℹ️ {account_id} {coin} {signal_type}: 포지션 종료 신호, 보유 코인 전부 매도 ({current_coin_balance}개)")
-            return _execute_sell_order(db, account_id, coin, current_coin_balance, current_price)
-        
-        # hold: 변경 없음
-        elif signal_type == "hold":
+        # hold / 알 수 없는 신호는 현재가 조회 없이 바로 처리
+        if signal_type == "hold":
             logger.info(f"ℹ️ {account_id} {coin} {signal_type}: 홀드 신호, 주문 체결 없음")
             return True
+        handler = _ORDER_HANDLERS.get(signal_type)
+        if handler is None:
+            logger.warning(f"⚠️ {account_id} {coin} {signal_type}: 알 수 없는 신호 타입")
+            return False
         
+        # 현재가 조회 (일괄 조회한 값이 있으면 재사용)
+        if price_map is not None:
+            current_price = price_map.get(coin)
         else:
-            logger.warning(f"⚠️ {account_id} {coin} {signal_type}: 알 수 없는 신호 타입")
+            current_price = get_current_price(db, coin)
+        if not current_price:
+            logger.error(f"❌ {coin} 현재가 조회 실패")
             return False
+        
+        # 신호 타입별 체결 함수 호출
+        return handler(db, signal, coin, signal_type, current_price, account_map, pending_rows, now)
     
     except Exception as e:
         logger.error(f"❌ 주문 체결 오류: {e}")
         return False
 
 
-def _execute_buy_order(db: Session, account_id: str, coin: str, quantity: float, price: float) -> bool:
+def _execute_buy_order(
+    db: Session,
+    account_id: str,
+    coin: str,
+    quantity: Decimal,
+    price: Decimal,
+    account_map: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = None,
+    pending_rows: Optional[List[Dict[str, Any]]] = None,
+    now: Optional[datetime] = None
+) -> bool:
     """
     매수 주문 체결
     KRW 잔액에서 코인 수량만큼 차감하고, 코인 잔액을 증가시킵니다.
@@ -200,6 +324,9 @@ def _execute_buy_order(db: Session, account_id: str, coin: str, quantity: float,
         coin: 코인 심볼
         quantity: 구매 수량
         price: 구매 가격
+        account_map: 미리 조회한 최신 계정 행 (체결 후 새 행으로 갱신)
+        pending_rows: 주어지면 새 계정 행을 저장하지 않고 여기에 추가
+        now: 새 계정 행의 collected_at (None이면 현재 시각)
     
     Returns:
         bool: 체결 성공 여부
@@ -209,29 +336,23 @@ def _execute_buy_order(db: Session, account_id: str, coin: str, quantity: float,
         required_krw = quantity * price
         
         # KRW 잔액 조회
-        krw_account = db.query(UpbitAccounts).filter(
-            UpbitAccounts.account_id == account_id,
-            UpbitAccounts.currency == "KRW"
-        ).order_by(desc(UpbitAccounts.collected_at)).first()
+        krw_account = _get_latest_account(db, account_id, "KRW", account_map)
         
         if not krw_account:
             logger.error(f"❌ {account_id} KRW 계정을 찾을 수 없습니다")
             return False
         
-        current_krw = float(krw_account.balance) if krw_account.balance else 0.0
+        current_krw = krw_account["balance"] or Decimal("0")
         
         if current_krw < required_krw:
             logger.warning(f"⚠️ {account_id} {coin} 매수: KRW 잔액 부족 (필요: {required_krw:,.0f}, 보유: {current_krw:,.0f})")
             return False
         
         # 코인 계정 조회 또는 생성
-        coin_account = db.query(UpbitAccounts).filter(
-            UpbitAccounts.account_id == account_id,
-            UpbitAccounts.currency == f"KRW-{coin}"
-        ).order_by(desc(UpbitAccounts.collected_at)).first()
+        coin_account = _get_latest_account(db, account_id, f"KRW-{coin}", account_map)
         
-        current_coin_balance = float(coin_account.balance) if coin_account and coin_account.balance else 0.0
-        current_avg_price = float(coin_account.avg_buy_price) if coin_account and coin_account.avg_buy_price else 0.0
+        current_coin_balance = (coin_account["balance"] if coin_account else None) or Decimal("0")
+        current_avg_price = (coin_account["avg_buy_price"] if coin_account else None) or Decimal("0")
         
         # 평균 매수가 계산 (가중 평균)
         new_coin_balance = current_coin_balance + quantity
@@ -247,52 +368,67 @@ def _execute_buy_order(db: Session, account_id: str, coin: str, quantity: float,
         new_krw_balance = current_krw - required_krw
         
         # 현재 시각
-        now = datetime.now(timezone.utc)
-        
-        # account_id를 UUID로 변환 (데이터베이스가 UUID 타입이므로)
-        try:
-            account_id_uuid = UUID(account_id) if isinstance(account_id, str) else account_id
-        except (ValueError, AttributeError):
-            account_id_uuid = account_id
+        if now is None:
+            now = datetime.now(timezone.utc)
         
         # KRW 계정 업데이트
-        new_krw_account = UpbitAccounts(
-            account_id=str(account_id_uuid),  # UUID를 문자열로 변환하여 저장
-            currency="KRW",
-            balance=Decimal(str(new_krw_balance)),
-            locked=krw_account.locked,
-            avg_buy_price=krw_account.avg_buy_price,
-            avg_buy_price_modified=krw_account.avg_buy_price_modified,
-            unit_currency=krw_account.unit_currency,
-            collected_at=now
-        )
-        db.add(new_krw_account)
+        new_krw_account = {
+            "account_id": account_id,
+            "currency": "KRW",
+            "balance": _quantize_account_value(new_krw_balance),
+            "locked": krw_account["locked"],
+            "avg_buy_price": krw_account["avg_buy_price"],
+            "avg_buy_price_modified": krw_account["avg_buy_price_modified"],
+            "unit_currency": krw_account["unit_currency"],
+            "collected_at": now
+        }
         
         # 코인 계정 업데이트 또는 생성
-        new_coin_account = UpbitAccounts(
-            account_id=account_id,
-            currency=f"KRW-{coin}",
-            balance=Decimal(str(new_coin_balance)),
-            locked=coin_account.locked if coin_account else None,
-            avg_buy_price=Decimal(str(new_avg_price)),
-            avg_buy_price_modified=coin_account.avg_buy_price_modified if coin_account else False,
-            unit_currency="KRW",
-            collected_at=now
-        )
-        db.add(new_coin_account)
+        new_coin_account = {
+            "account_id": account_id,
+            "currency": f"KRW-{coin}",
+            "balance": _quantize_account_value(new_coin_balance),
+            "locked": coin_account["locked"] if coin_account else None,
+            "avg_buy_price": _quantize_account_value(new_avg_price),
+            "avg_buy_price_modified": coin_account["avg_buy_price_modified"] if coin_account else False,
+            "unit_currency": "KRW",
+            "collected_at": now
+        }
         
-        db.commit()
+        if pending_rows is not None:
+            pending_rows.append(new_krw_account)
+            pending_rows.append(new_coin_account)
+        else:
+            db.execute(insert(UpbitAccounts), [new_krw_account, new_coin_account])
+            db.commit()
+            # 잔액이 바뀌었으므로 검증용 잔액 캐시 무효화
+            invalidate_balance_cache(str(account_id))
+        
+        # 같은 배치의 다음 주문이 방금 저장한 잔액을 보도록 갱신
+        if account_map is not None:
+            account_map[(str(account_id), "KRW")] = new_krw_account
+            account_map[(str(account_id), f"KRW-{coin}")] = new_coin_account
         
         logger.info(f"✅ {account_id} {coin} 매수 체결 완료: {quantity}개 @ {price:,.0f}원 (총 {required_krw:,.0f}원)")
         return True
     
     except Exception as e:
-        db.rollback()
+        if pending_rows is None:
+            db.rollback()
         logger.error(f"❌ {account_id} {coin} 매수 체결 실패: {e}")
         return False
 
 
-def _execute_sell_order(db: Session, account_id: str, coin: str, quantity: float, price: float) -> bool:
+def _execute_sell_order(
+    db: Session,
+    account_id: str,
+    coin: str,
+    quantity: Decimal,
+    price: Decimal,
+    account_map: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = None,
+    pending_rows: Optional[List[Dict[str, Any]]] = None,
+    now: Optional[datetime] = None
+) -> bool:
     """
     매도 주문 체결
     코인 잔액에서 수량만큼 차감하고, KRW 잔액을 증가시킵니다.
@@ -303,22 +439,22 @@ def _execute_sell_order(db: Session, account_id: str, coin: str, quantity: float
         coin: 코인 심볼
         quantity: 판매 수량
         price: 판매 가격
+        account_map: 미리 조회한 최신 계정 행 (체결 후 새 행으로 갱신)
+        pending_rows: 주어지면 새 계정 행을 저장하지 않고 여기에 추가
+        now: 새 계정 행의 collected_at (None이면 현재 시각)
     
     Returns:
         bool: 체결 성공 여부
     """
     try:
         # 코인 계정 조회
-        coin_account = db.query(UpbitAccounts).filter(
-            UpbitAccounts.account_id == account_id,
-            UpbitAccounts.currency == f"KRW-{coin}"
-        ).order_by(desc(UpbitAccounts.collected_at)).first()
+        coin_account = _get_latest_account(db, account_id, f"KRW-{coin}", account_map)
         
         if not coin_account:
             logger.error(f"❌ {account_id} {coin} 계정을 찾을 수 없습니다")
             return False
         
-        current_coin_balance = float(coin_account.balance) if coin_account.balance else 0.0
+        current_coin_balance = coin_account["balance"] or Decimal("0")
         
         if current_coin_balance < quantity:
             logger.warning(f"⚠️ {account_id} {coin} 매도: 코인 잔액 부족 (필요: {quantity}, 보유: {current_coin_balance})")
@@ -328,16 +464,13 @@ def _execute_sell_order(db: Session, account_id: str, coin: str, quantity: float
         received_krw = quantity * price
         
         # KRW 계정 조회
-        krw_account = db.query(UpbitAccounts).filter(
-            UpbitAccounts.account_id == account_id,
-            UpbitAccounts.currency == "KRW"
-        ).order_by(desc(UpbitAccounts.collected_at)).first()
+        krw_account = _get_latest_account(db, account_id, "KRW", account_map)
         
         if not krw_account:
             logger.error(f"❌ {account_id} KRW 계정을 찾을 수 없습니다")
             return False
         
-        current_krw = float(krw_account.balance) if krw_account.balance else 0.0
+        current_krw = krw_account["balance"] or Decimal("0")
         
         # 코인 잔액 차감
         new_coin_balance = current_coin_balance - quantity
@@ -346,69 +479,188 @@ def _execute_sell_order(db: Session, account_id: str, coin: str, quantity: float
         new_krw_balance = current_krw + received_krw
         
         # 평균 매수가는 유지 (매도 시에는 변경 없음)
-        new_avg_price = coin_account.avg_buy_price
+        new_avg_price = coin_account["avg_buy_price"]
         
         # 현재 시각
-        now = datetime.now(timezone.utc)
-        
-        # account_id를 UUID로 변환 (데이터베이스가 UUID 타입이므로)
-        try:
-            account_id_uuid = UUID(account_id) if isinstance(account_id, str) else account_id
-        except (ValueError, AttributeError):
-            account_id_uuid = account_id
+        if now is None:
+            now = datetime.now(timezone.utc)
         
         # KRW 계정 업데이트
-        new_krw_account = UpbitAccounts(
-            account_id=str(account_id_uuid),  # UUID를 문자열로 변환하여 저장
-            currency="KRW",
-            balance=Decimal(str(new_krw_balance)),
-            locked=krw_account.locked,
-            avg_buy_price=krw_account.avg_buy_price,
-            avg_buy_price_modified=krw_account.avg_buy_price_modified,
-            unit_currency=krw_account.unit_currency,
-            collected_at=now
-        )
-        db.add(new_krw_account)
+        new_krw_account = {
+            "account_id": account_id,
+            "currency": "KRW",
+            "balance": _quantize_account_value(new_krw_balance),
+            "locked": krw_account["locked"],
+            "avg_buy_price": krw_account["avg_buy_price"],
+            "avg_buy_price_modified": krw_account["avg_buy_price_modified"],
+            "unit_currency": krw_account["unit_currency"],
+            "collected_at": now
+        }
         
         # 코인 계정 업데이트
         if new_coin_balance > 0:
             # 코인 잔액이 남아있으면 업데이트
-            new_coin_account = UpbitAccounts(
-                account_id=account_id,
-                currency=f"KRW-{coin}",
-                balance=Decimal(str(new_coin_balance)),
-                locked=coin_account.locked,
-                avg_buy_price=new_avg_price,
-                avg_buy_price_modified=coin_account.avg_buy_price_modified,
-                unit_currency="KRW",
-                collected_at=now
-            )
-            db.add(new_coin_account)
+            new_coin_account = {
+                "account_id": account_id,
+                "currency": f"KRW-{coin}",
+                "balance": _quantize_account_value(new_coin_balance),
+                "locked": coin_account["locked"],
+                "avg_buy_price": new_avg_price,
+                "avg_buy_price_modified": coin_account["avg_buy_price_modified"],
+                "unit_currency": "KRW",
+                "collected_at": now
+            }
         else:
             # 코인 잔액이 0이면 삭제하지 않고 0으로 업데이트
-            new_coin_account = UpbitAccounts(
-                account_id=account_id,
-                currency=f"KRW-{coin}",
-                balance=Decimal("0"),
-                locked=coin_account.locked,
-                avg_buy_price=new_avg_price,
-                avg_buy_price_modified=coin_account.avg_buy_price_modified,
-                unit_currency="KRW",
-                collected_at=now
-            )
-            db.add(new_coin_account)
+            new_coin_account = {
+                "account_id": account_id,
+                "currency": f"KRW-{coin}",
+                "balance": Decimal("0"),
+                "locked": coin_account["locked"],
+                "avg_buy_price": new_avg_price,
+                "avg_buy_price_modified": coin_account["avg_buy_price_modified"],
+                "unit_currency": "KRW",
+                "collected_at": now
+            }
+        
+        if pending_rows is not None:
+            pending_rows.append(new_krw_account)
+            pending_rows.append(new_coin_account)
+        else:
+            db.execute(insert(UpbitAccounts), [new_krw_account, new_coin_account])
+            db.commit()
+            # 잔액이 바뀌었으므로 검증용 잔액 캐시 무효화
+            invalidate_balance_cache(str(account_id))
         
-        db.commit()
+        # 같은 배치의 다음 주문이 방금 저장한 잔액을 보도록 갱신
+        if account_map is not None:
+            account_map[(str(account_id), "KRW")] = new_krw_account
+            account_map[(str(account_id), f"KRW-{coin}")] = new_coin_account
         
         logger.info(f"✅ {account_id} {coin} 매도 체결 완료: {quantity}개 @ {price:,.0f}원 (총 {received_krw:,.0f}원)")
         return True
     
     except Exception as e:
-        db.rollback()
+        if pending_rows is None:
+            db.rollback()
         logger.error(f"❌ {account_id} {coin} 매도 체결 실패: {e}")
         return False
 
 
+def _resolve_order_quantity(
+    signal: LLMTradingSignal,
+    coin: str,
+    signal_type: str,
+    current_price: Decimal
+) -> Optional[Decimal]:
+    """
+    매수/매도 수량 계산 (quantity 우선, 없으면 risk_usd 기준)
+    
+    Returns:
+        Optional[Decimal]: 주문 수량 (수량 정보가 없거나 0 이하이면 None)
+    """
+    account_id = signal.account_id
+    quantity = None
+    if signal.quantity and signal.quantity > 0:
+        quantity = signal.quantity
+    elif signal.risk_usd and signal.risk_usd > 0:
+        # risk_usd 기반으로 수량 계산 (KRW 기준)
+        quantity = signal.risk_usd / current_price
+    else:
+        logger.warning(f"⚠️ {account_id} {coin} {signal_type}: 수량 정보가 없습니다")
+        return None
+    
+    if quantity <= 0:
+        logger.warning(f"⚠️ {account_id} {coin} {signal_type}: 수량이 0 이하입니다")
+        return None
+    
+    return quantity
+
+
+def _handle_buy_to_enter(
+    db: Session,
+    signal: LLMTradingSignal,
+    coin: str,
+    signal_type: str,
+    current_price: Decimal,
+    account_map: Optional[Dict[Tuple[str, str], Dict[str, Any]]],
+    pending_rows: Optional[List[Dict[str, Any]]],
+    now: Optional[datetime]
+) -> bool:
+    """buy_to_enter: KRW에서 코인으로 변환"""
+    quantity = _resolve_order_quantity(signal, coin, signal_type, current_price)
+    if quantity is None:
+        return False
+    
+    return _execute_buy_order(
+        db, signal.account_id, coin, quantity, current_price,
+        account_map=account_map, pending_rows=pending_rows, now=now
+    )
+
+
+def _handle_sell_to_exit(
+    db: Session,
+    signal: LLMTradingSignal,
+    coin: str,
+    signal_type: str,
+    current_price: Decimal,
+    account_map: Optional[Dict[Tuple[str, str], Dict[str, Any]]],
+    pending_rows: Optional[List[Dict[str, Any]]],
+    now: Optional[datetime]
+) -> bool:
+    """sell_to_exit: 코인에서 KRW로 변환 (일부 판매)"""
+    quantity = _resolve_order_quantity(signal, coin, signal_type, current_price)
+    if quantity is None:
+        return False
+    
+    return _execute_sell_order(
+        db, signal.account_id, coin, quantity, current_price,
+        account_map=account_map, pending_rows=pending_rows, now=now
+    )
+
+
+def _handle_close_position(
+    db: Session,
+    signal: LLMTradingSignal,
+    coin: str,
+    signal_type: str,
+    current_price: Decimal,
+    account_map: Optional[Dict[Tuple[str, str], Dict[str, Any]]],
+    pending_rows: Optional[List[Dict[str, Any]]],
+    now: Optional[datetime]
+) -> bool:
+    """close_position: 포지션 종료 (전부 판매)"""
+    account_id = signal.account_id
+    
+    # 보유한 코인 잔액을 전부 조회
+    coin_account = _get_latest_account(db, account_id, f"KRW-{coin}", account_map)
+    
+    if not coin_account:
+        logger.error(f"❌ {account_id} {coin} 계정을 찾을 수 없습니다")
+        return False
+    
+    current_coin_balance = coin_account["balance"] or Decimal("0")
+    
+    if current_coin_balance <= 0:
+        logger.warning(f"⚠️ {account_id} {coin} {signal_type}: 보유 코인이 없습니다 (잔액: {current_coin_balance})")
+        return False
+    
+    # 보유한 코인을 전부 매도
+    logger.info(f"ℹ️ {account_id} {coin} {signal_type}: 포지션 종료 신호, 보유 코인 전부 매도 ({current_coin_balance}개)")
+    return _execute_sell_order(
+        db, account_id, coin, current_coin_balance, current_price,
+        account_map=account_map, pending_rows=pending_rows, now=now
+    )
+
+
+# 가격 조회와 잔액 변경이 필요한 신호 타입별 체결 함수 (hold는 체결 없음)
+_ORDER_HANDLERS = {
+    "buy_to_enter": _handle_buy_to_enter,
+    "sell_to_exit": _handle_sell_to_exit,
+    "close_position": _handle_close_position,
+}
+
+
 def execute_signal_orders(db: Session, prompt_id: Optional[int] = None) -> dict:
     """
     저장된 LLM 거래 신호를 기반으로 주문을 체결합니다.
@@ -421,59 +673,105 @@ def execute_signal_orders(db: Session, prompt_id: Optional[int] = None) -> dict:
         dict: 체결 결과 통계
     """
     try:
-        # 체결할 signal 조회
+        # 체결할 signal 조회 조건
         if prompt_id:
-            signals = db.query(LLMTradingSignal).filter(
-                LLMTradingSignal.prompt_id == prompt_id
-            ).all()
+            prompt_filter = LLMTradingSignal.prompt_id == prompt_id
         else:
-            # 최신 signal만 체결 (같은 prompt_id의 signal들)
-            latest_prompt = db.query(LLMTradingSignal).order_by(
+            # 최신 signal만 체결 (같은 prompt_id의 signal들, 최신 prompt_id는 서브쿼리로 함께 조회)
+            latest_prompt_id = select(LLMTradingSignal.prompt_id).order_by(
                 desc(LLMTradingSignal.created_at)
-            ).first()
-            
-            if not latest_prompt:
-                logger.warning("⚠️ 체결할 signal이 없습니다")
-                return {"success": False, "message": "체결할 signal이 없습니다"}
-            
-            signals = db.query(LLMTradingSignal).filter(
-                LLMTradingSignal.prompt_id == latest_prompt.prompt_id
-            ).all()
-        
-        if not signals:
-            logger.warning("⚠️ 체결할 signal이 없습니다")
-            return {"success": False, "message": "체결할 signal이 없습니다"}
-        
-        # 체결 결과 통계
+            ).limit(1).scalar_subquery()
+            prompt_filter = LLMTradingSignal.prompt_id == latest_prompt_id
+        
+        # signal을 한 번에 모두 적재하지 않고 SIGNAL_FETCH_BATCH_SIZE개씩 스트리밍
+        signal_batches = db.execute(
+            select(LLMTradingSignal)
+            .where(prompt_filter)
+            # 저장된 순서대로 체결 (같은 계정의 매도/매수 순서가 결과에 영향을 주므로 인덱스 선택과 무관하게 고정)
+            .order_by(LLMTradingSignal.id)
+            .execution_options(yield_per=SIGNAL_FETCH_BATCH_SIZE)
+        ).scalars().partitions()
+        
+        # 체결 결과 통계 (total은 마지막에 계산)
         results = {
             "success": True,
-            "total": len(signals),
+            "total": 0,
             "executed": 0,
             "failed": 0,
             "details": []
         }
         
-        # 각 signal 체결
-        for signal in signals:
-            success = execute_order(db, signal)
-            if success:
-                results["executed"] += 1
-            else:
-                results["failed"] += 1
+        # 현재가/계정 최신 행은 묶음마다 아직 조회하지 않은 것만 추가로 조회
+        # (account_map은 체결 시 새 행으로 갱신되므로 이미 조회한 쌍은 다시 덮어쓰지 않음)
+        price_map = {}
+        account_map = {}
+        fetched_coins = set()
+        fetched_account_pairs = set()
+        
+        # 각 signal 체결 (새 계정 행은 모아 두었다가 마지막에 한 번에 INSERT 후 커밋)
+        pending_rows = []
+        executed_account_ids = set()
+        # 체결 시각은 배치 시작 시 한 번만 읽고, 같은 계정의 행끼리 collected_at이 겹쳐
+        # 최신 행 판별이 모호해지지 않도록 signal 순서대로 1마이크로초씩 더함
+        batch_now = datetime.now(timezone.utc)
+        index = 0
+        for signals in signal_batches:
+            # 체결이 필요한 신호에 등장하는 코인의 현재가와 계정(KRW + 코인)의 최신 행을 한 번에 조회
+            coins = set()
+            account_pairs = set()
+            for signal in signals:
+                if signal.signal.lower() not in _ORDER_HANDLERS:
+                    continue
+                coin = signal.coin.upper()
+                account_id = str(signal.account_id)
+                coins.add(coin)
+                account_pairs.add((account_id, "KRW"))
+                account_pairs.add((account_id, f"KRW-{coin}"))
+            coins -= fetched_coins
+            account_pairs -= fetched_account_pairs
+            price_map.update(get_current_prices(db, coins))
+            account_map.update(get_latest_accounts(db, account_pairs))
+            fetched_coins |= coins
+            fetched_account_pairs |= account_pairs
             
-            results["details"].append({
-                "signal_id": signal.id,
-                "account_id": signal.account_id,
-                "coin": signal.coin,
-                "signal": signal.signal,
-                "success": success
-            })
+            for signal in signals:
+                success = execute_order(
+                    db, signal, price_map=price_map, account_map=account_map, pending_rows=pending_rows,
+                    now=batch_now + timedelta(microseconds=index)
+                )
+                index += 1
+                if success:
+                    results["executed"] += 1
+                    executed_account_ids.add(str(signal.account_id))
+                else:
+                    results["failed"] += 1
+                
+                results["details"].append({
+                    "signal_id": signal.id,
+                    "account_id": signal.account_id,
+                    "coin": signal.coin,
+                    "signal": signal.signal,
+                    "success": success
+                })
+        
+        results["total"] = results["executed"] + results["failed"]
+        if not results["total"]:
+            logger.warning("⚠️ 체결할 signal이 없습니다")
+            return {"success": False, "message": "체결할 signal이 없습니다"}
+        
+        if pending_rows:
+            db.execute(insert(UpbitAccounts), pending_rows)
+        db.commit()
+        # 잔액이 바뀌었으므로 검증용 잔액 캐시 무효화
+        for account_id in executed_account_ids:
+            invalidate_balance_cache(account_id)
         
         logger.info(f"✅ 주문 체결 완료: 총 {results['total']}개, 성공 {results['executed']}개, 실패 {results['failed']}개")
         
         return results
     
     except Exception as e:
+        db.rollback()
         logger.error(f"❌ 주문 체결 오류: {e}")
         return {"success": False, "message": f"주문 체결 중 오류 발생: {str(e)}"}
 
@@ -21,11 +21,15 @@
 """
 
 import logging
+import time
+import numpy as np
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import List, Dict, Optional, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, and_, case, or_
+from functools import lru_cache, wraps
+from threading import Lock
+from typing import List, Dict, Iterator, Optional, Any, Tuple
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import func, desc, and_, case, or_, select, cast, Float, lambda_stmt
 from uuid import UUID
 
 from app.db.database import (
@@ -40,6 +44,29 @@ from app.core.config import LLMAccountConfig
 
 logger = logging.getLogger(__name__)
 
+# 대량 조회 시 서버 측 커서로 한 번에 가져올 행 수
+STATISTICS_FETCH_BATCH_SIZE = 1000
+
+# 통계 결과 캐시: 대시보드가 같은 조건으로 반복 호출하므로 짧은 시간 동안 결과를 재사용
+# 키: (함수명, 인자) -> 값: (만료 시각(monotonic), 결과), 인자 값이 정확히 같은 호출만 결과를 공유
+STATISTICS_CACHE_TTL_SECONDS = 60
+_STATISTICS_CACHE_MAX_SIZE = 256
+_statistics_cache: Dict[Tuple, Tuple[float, Any]] = {}
+_statistics_cache_lock = Lock()
+
+# 상관관계 분석에서 지원하는 지표 타입 -> UpbitIndicators 컬럼
+_INDICATOR_COLUMNS = {
+    "rsi14": UpbitIndicators.rsi14,
+    "macd": UpbitIndicators.macd,
+    "macd_hist": UpbitIndicators.macd_hist,
+    "ema12": UpbitIndicators.ema12,
+    "ema20": UpbitIndicators.ema20,
+    "ema26": UpbitIndicators.ema26,
+    "ema50": UpbitIndicators.ema50,
+    "atr3": UpbitIndicators.atr3,
+    "atr14": UpbitIndicators.atr14,
+}
+
 
 # ==================== 유틸리티 함수 ====================
 
@@ -60,6 +87,17 @@ def _get_model_name_from_account_id(account_id: Optional[UUID]) -> Optional[str]
     """
     if not account_id:
         return None
+    return _get_model_name_cached(account_id)
+
+
+@lru_cache(maxsize=256)
+def _get_model_name_cached(account_id) -> Optional[str]:
+    """
+    account_id(UUID 또는 문자열)로 모델명을 조회하는 캐시 함수
+    
+    계정 수가 적어 같은 account_id가 행마다 반복되므로 결과를 메모이제이션합니다.
+    캐시 키로 account_id를 그대로 사용하여 캐시 적중 시 문자열 변환도 하지 않습니다.
+    """
     try:
         # LLMAccountConfig를 통해 account_id를 모델명으로 변환
         return LLMAccountConfig.get_model_for_account_id(str(account_id))
@@ -79,24 +117,270 @@ def _get_user_id_from_account_id(account_id: Optional[UUID]) -> Optional[int]:
         Optional[int]: user_id (1, 2, 3, 4 중 하나), 추출 실패 시 None
     
     설명:
-        - account_id의 마지막 12자리 숫자에서 앞의 0을 제거하여 user_id를 추출합니다
+        - account_id의 마지막 12자리 숫자를 정수로 변환하여 user_id를 추출합니다
         - AccountInformation 테이블은 user_id를 문자열로 저장하므로 이를 변환합니다
         - 예: "00000000-0000-0000-0000-000000000001" -> 1
     """
     if not account_id:
         return None
+    return _get_user_id_cached(account_id)
+
+
+@lru_cache(maxsize=256)
+def _get_user_id_cached(account_id) -> Optional[int]:
+    """
+    account_id(UUID 또는 문자열)에서 user_id를 추출하는 캐시 함수
+    """
     try:
-        # UUID의 마지막 부분(12자리)에서 앞의 0을 제거하고 숫자로 변환
-        # 예: "000000000001" -> "1" -> 1
-        suffix = str(account_id).split("-")[-1].lstrip("0") or "0"
-        return int(suffix)
+        # 마지막 12자리는 user_id를 10진수로 0 채움한 값이므로 int()가 앞의 0을 그대로 처리
+        # (UUID.node는 16진수로 해석되어 user_id가 10 이상이면 값이 달라지므로 사용하지 않음)
+        # 예: "000000000001" -> 1
+        return int(str(account_id).rsplit("-", 1)[-1])
     except Exception:
         # 변환 실패 시 None 반환
         return None
 
 
+def _get_account_information_user_id(account_id: Optional[UUID]) -> Optional[str]:
+    """
+    account_id를 AccountInformation.user_id 컬럼 값(문자열)으로 변환하는 내부 유틸리티 함수
+    
+    Args:
+        account_id: UUID 형식의 계정 ID
+    
+    Returns:
+        Optional[str]: AccountInformation 필터에 바로 쓸 수 있는 user_id 문자열 (예: "1"), 추출 실패 시 None
+    
+    설명:
+        - AccountInformation 테이블은 user_id를 문자열(Text)로 저장하므로 필터 값도 문자열이어야 합니다
+        - 조회마다 str() 변환을 반복하지 않도록 계정별 결과를 캐시합니다
+    """
+    if not account_id:
+        return None
+    return _get_account_information_user_id_cached(account_id)
+
+
+@lru_cache(maxsize=256)
+def _get_account_information_user_id_cached(account_id) -> Optional[str]:
+    """
+    account_id(UUID 또는 문자열)에서 AccountInformation user_id 문자열을 구하는 캐시 함수
+    """
+    user_id = _get_user_id_cached(account_id)
+    return str(user_id) if user_id else None
+
+
+def _latest_account_information_query(db: Session, date: datetime, user_id: Optional[str] = None):
+    """
+    지정된 시점 이전의 계정별 최신 AccountInformation 기록을 조회하는 쿼리
+    
+    Args:
+        db: 데이터베이스 세션 객체
+        date: 기준 시점 (이 시점 이전 기록만 대상)
+        user_id: 특정 사용자로 필터링 (AccountInformation.user_id 문자열, None이면 전체 사용자)
+    
+    Returns:
+        사용자(user_id)마다 최신 기록 한 건을 user_id 순으로 반환하는 AccountInformation 쿼리
+    
+    설명:
+        - MAX(created_at) 서브쿼리와 셀프 조인 대신 ROW_NUMBER() 윈도우 함수로 한 번만 스캔합니다
+        - 같은 시각의 기록이 여러 개면 id가 가장 큰(마지막으로 저장된) 기록 하나만 사용합니다
+    """
+    ranked_query = (
+        db.query(
+            AccountInformation.id.label("id"),
+            func.row_number().over(
+                partition_by=AccountInformation.user_id,
+                order_by=(desc(AccountInformation.created_at), desc(AccountInformation.id))
+            ).label("row_number")
+        )
+        .filter(AccountInformation.created_at <= date)
+    )
+    
+    if user_id:
+        ranked_query = ranked_query.filter(AccountInformation.user_id == user_id)
+    
+    ranked = ranked_query.subquery()
+    
+    return (
+        db.query(AccountInformation)
+        .join(ranked, AccountInformation.id == ranked.c.id)
+        .filter(ranked.c.row_number == 1)
+        .order_by(AccountInformation.user_id)
+    )
+
+
+def _build_balance_change_rows(rows) -> List[Dict]:
+    """
+    잔액 변화 조회 결과 한 배치를 응답 딕셔너리 리스트로 변환하는 함수
+    
+    Args:
+        rows: (id, account_id, coin, signal_type, execution_status,
+               balance_before, balance_after, executed_at) 튜플 리스트 (잔액은 float)
+    
+    Returns:
+        List[Dict]: get_balance_change_statistics 응답 형식의 딕셔너리 리스트
+    
+    설명:
+        - 잔액 변화량/변화율은 행마다 계산하지 않고 NumPy 배열 연산으로 배치 전체를 한 번에 계산합니다
+        - 잔액 변화량 = 거래 후 잔액 - 거래 전 잔액 (거래 전후 잔액이 모두 0이 아닌 경우에만)
+        - 잔액 변화율 = (변화량 / 거래 전 잔액) * 100 (거래 전 잔액이 양수인 경우에만)
+    """
+    if not rows:
+        return []
+    
+    balance_before = np.fromiter((row[5] for row in rows), dtype=np.float64, count=len(rows))
+    balance_after = np.fromiter((row[6] for row in rows), dtype=np.float64, count=len(rows))
+    has_change = (balance_before != 0) & (balance_after != 0)
+    has_rate = has_change & (balance_before > 0)
+    change = balance_after - balance_before
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rate = change / balance_before * 100
+    
+    return [
+        {
+            "execution_id": execution_id,
+            "account_id": str(exec_account_id) if exec_account_id else None,
+            "model_name": _get_model_name_from_account_id(exec_account_id),
+            "coin": exec_coin,
+            "signal_type": signal_type,
+            "execution_status": execution_status,
+            "balance_before": before if before else None,
+            "balance_after": after if after else None,
+            "balance_change": row_change if row_has_change else None,
+            "balance_change_rate": row_rate if row_has_rate else None,
+            "executed_at": executed_at.isoformat() if executed_at else None,
+        }
+        for (
+            (execution_id, exec_account_id, exec_coin, signal_type,
+             execution_status, before, after, executed_at),
+            row_change, row_rate, row_has_change, row_has_rate,
+        ) in zip(rows, change.tolist(), rate.tolist(), has_change.tolist(), has_rate.tolist())
+    ]
+
+
+def _build_indicator_correlation_rows(rows, indicator_type: str) -> List[Dict]:
+    """
+    지표-수익률 조회 결과 한 배치를 응답 딕셔너리 리스트로 변환하는 함수
+    
+    Args:
+        rows: (id, executed_at, indicator_value, profit_rate) 튜플 리스트 (지표 값/수익률은 float)
+        indicator_type: 응답에 포함할 지표 타입
+    
+    Returns:
+        List[Dict]: get_indicator_profit_correlation 응답 형식의 딕셔너리 리스트
+    
+    설명:
+        - 지표 값이 없거나 0인 행은 행마다 검사하지 않고 NumPy 마스크로 배치 전체를 한 번에 걸러냅니다
+    """
+    if not rows:
+        return []
+    
+    indicator_values = np.array([row[2] for row in rows], dtype=np.float64)
+    has_value = (indicator_values != 0) & ~np.isnan(indicator_values)
+    
+    return [
+        {
+            "execution_id": execution_id,
+            "indicator_type": indicator_type,
+            "indicator_value": indicator_value,
+            "profit_rate": profit_rate,
+            "executed_at": executed_at.isoformat(),
+        }
+        for (execution_id, executed_at, indicator_value, profit_rate), row_has_value
+        in zip(rows, has_value.tolist())
+        if row_has_value
+    ]
+
+
+def _cached_statistics(func):
+    """
+    통계 함수 결과를 STATISTICS_CACHE_TTL_SECONDS 동안 캐시하는 데코레이터
+    
+    설명:
+        - 첫 번째 인자(db 세션)를 제외한 인자 값 그대로 캐시 키를 만듭니다 (datetime도 그대로 비교)
+        - 캐시된 결과 객체는 호출자 간에 공유되므로 호출자는 결과를 수정하지 않아야 합니다
+        - 거래 실행 기록/계좌 정보가 저장되면 invalidate_statistics_cache()로 전체 캐시를 비웁니다
+    """
+    @wraps(func)
+    def wrapper(db: Session, *args, **kwargs):
+        key = (
+            func.__name__,
+            args,
+            tuple(sorted(kwargs.items())),
+        )
+        now = time.monotonic()
+        with _statistics_cache_lock:
+            entry = _statistics_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        
+        result = func(db, *args, **kwargs)
+        
+        with _statistics_cache_lock:
+            # 최대 크기 초과 시 만료 항목 정리, 그래도 크면 전체 비움
+            if len(_statistics_cache) >= _STATISTICS_CACHE_MAX_SIZE:
+                for expired_key in [k for k, (expires_at, _) in _statistics_cache.items() if expires_at <= now]:
+                    del _statistics_cache[expired_key]
+                if len(_statistics_cache) >= _STATISTICS_CACHE_MAX_SIZE:
+                    _statistics_cache.clear()
+            _statistics_cache[key] = (now + STATISTICS_CACHE_TTL_SECONDS, result)
+        return result
+    return wrapper
+
+
+def invalidate_statistics_cache() -> None:
+    """
+    통계 결과 캐시 전체 무효화 (거래 실행 기록이나 계좌 정보가 저장된 뒤 호출)
+    """
+    with _statistics_cache_lock:
+        _statistics_cache.clear()
+
+
+def _has_rows(db: Session, query) -> bool:
+    """
+    조회 조건에 맞는 행이 하나라도 있는지 EXISTS로 확인하는 함수
+    
+    Args:
+        db: 데이터베이스 세션 객체
+        query: 필터가 적용된 조회 쿼리
+    
+    Returns:
+        bool: 행이 하나 이상 있으면 True
+    
+    설명:
+        - 데이터가 없는 기간을 조회할 때 그룹화/정렬을 실행하지 않고 바로 빈 결과를 반환하기 위해 사용합니다
+        - EXISTS는 첫 번째 행을 찾는 즉시 종료되므로 비용이 작습니다
+    """
+    return bool(db.query(query.exists()).scalar())
+
+
+def _matching_success_execution_id():
+    """
+    신호와 같은 (prompt_id, coin)의 첫 번째 성공 실행 기록 ID를 구하는 상관 스칼라 서브쿼리
+    
+    Returns:
+        LLMTradingSignal 행마다 평가되는 스칼라 서브쿼리 (실행 기록이 없으면 NULL)
+    
+    설명:
+        - 신호마다 실행 기록을 따로 조회하던 N+1 쿼리를 JOIN 한 번으로 바꾸기 위해 사용합니다
+        - 같은 (prompt_id, coin)에 성공 기록이 여러 개면 가장 먼저 저장된(id가 가장 작은) 기록 하나만 매칭합니다
+    """
+    execution = aliased(LLMTradingExecution)
+    return (
+        select(func.min(execution.id))
+        .where(
+            execution.prompt_id == LLMTradingSignal.prompt_id,
+            execution.coin == LLMTradingSignal.coin,
+            execution.execution_status == "success"
+        )
+        .correlate(LLMTradingSignal)
+        .scalar_subquery()
+    )
+
+
 # ==================== 수익성 통계 ====================
 
+@_cached_statistics
 def get_balance_change_statistics(
     db: Session,
     account_id: Optional[UUID] = None,
@@ -134,11 +418,50 @@ def get_balance_change_statistics(
         1. LLMTradingExecution 테이블에서 balance_before와 balance_after가 모두 있는 기록만 조회
         2. account_id, start_date, end_date로 필터링
         3. executed_at 기준으로 정렬
-        4. 각 거래에 대해 잔액 변화량과 변화율 계산
+        4. 배치 단위로 잔액 변화량과 변화율을 NumPy 벡터 연산으로 계산
         5. 모델명을 account_id로부터 조회하여 포함
+    
+    참고:
+        - 결과 전체를 리스트로 만들지 않고 순회하려면 iter_balance_change_statistics를 사용합니다
+    """
+    return list(iter_balance_change_statistics(db, account_id, start_date, end_date))
+
+
+def iter_balance_change_statistics(
+    db: Session,
+    account_id: Optional[UUID] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+) -> Iterator[Dict]:
+    """
+    거래 전후 잔액 변화 통계를 한 건씩 생성하는 제너레이터
+    
+    get_balance_change_statistics와 같은 조건/형식이지만, 서버 측 커서에서 배치 단위로 가져온 행을
+    바로 변환해 내보내므로 조회 기간이 길어도 메모리 사용량이 배치 크기로 제한됩니다.
+    제너레이터를 모두 소비하기 전까지 db 세션을 닫으면 안 됩니다.
+    
+    Args:
+        db: 데이터베이스 세션 객체
+        account_id: 특정 계정 ID로 필터링 (None이면 전체 계정)
+        start_date: 조회 시작 날짜 (None이면 제한 없음)
+        end_date: 조회 종료 날짜 (None이면 제한 없음)
+    
+    Yields:
+        Dict: 거래별 잔액 변화 데이터 (get_balance_change_statistics 항목과 동일)
     """
     # 거래 전후 잔액이 모두 있는 실행 기록만 조회
-    query = db.query(LLMTradingExecution).filter(
+    # (ORM 객체 대신 필요한 컬럼만 튜플로 조회하여 객체 생성 비용을 줄임)
+    # 잔액은 응답에서 float로만 쓰이므로 DB에서 float로 변환해 행마다 Decimal 생성/연산을 피함
+    query = db.query(
+        LLMTradingExecution.id,
+        LLMTradingExecution.account_id,
+        LLMTradingExecution.coin,
+        LLMTradingExecution.signal_type,
+        LLMTradingExecution.execution_status,
+        cast(LLMTradingExecution.balance_before, Float),
+        cast(LLMTradingExecution.balance_after, Float),
+        LLMTradingExecution.executed_at,
+    ).filter(
         LLMTradingExecution.balance_before.isnot(None),
         LLMTradingExecution.balance_after.isnot(None),
     )
@@ -154,43 +477,21 @@ def get_balance_change_statistics(
         query = query.filter(LLMTradingExecution.executed_at <= end_date)
     
     # 실행 시각 기준으로 정렬하여 조회
-    executions = query.order_by(LLMTradingExecution.executed_at).all()
+    # 기간이 넓으면 행이 많으므로 서버 측 커서로 배치 단위 스트리밍
+    # 조건에 맞는 기록이 없으면 정렬/조회를 생략
+    if not _has_rows(db, query):
+        return
     
-    results = []
-    for exec in executions:
-        # 잔액 변화량과 변화율 초기화
-        balance_change = None
-        balance_change_rate = None
-        
-        # 거래 전후 잔액이 모두 있는 경우에만 계산
-        if exec.balance_before and exec.balance_after:
-            # 잔액 변화량 = 거래 후 잔액 - 거래 전 잔액
-            balance_change = float(exec.balance_after - exec.balance_before)
-            # 잔액 변화율 = (변화량 / 거래 전 잔액) * 100
-            if exec.balance_before > 0:
-                balance_change_rate = float((exec.balance_after - exec.balance_before) / exec.balance_before * 100)
-        
-        # account_id로부터 모델명 조회
-        model_name = _get_model_name_from_account_id(exec.account_id)
-        
-        # 결과 딕셔너리 생성
-        results.append({
-            "execution_id": exec.id,
-            "account_id": str(exec.account_id) if exec.account_id else None,
-            "model_name": model_name,
-            "coin": exec.coin,
-            "signal_type": exec.signal_type,
-            "execution_status": exec.execution_status,
-            "balance_before": float(exec.balance_before) if exec.balance_before else None,
-            "balance_after": float(exec.balance_after) if exec.balance_after else None,
-            "balance_change": balance_change,
-            "balance_change_rate": balance_change_rate,
-            "executed_at": exec.executed_at.isoformat() if exec.executed_at else None,
-        })
+    statement = query.order_by(LLMTradingExecution.executed_at).statement.execution_options(
+        yield_per=STATISTICS_FETCH_BATCH_SIZE
+    )
     
-    return results
+    # 배치마다 잔액 변화량/변화율을 벡터 연산으로 계산
+    for partition in db.execute(statement).partitions():
+        yield from _build_balance_change_rows(partition)
 
 
+@_cached_statistics
 def get_coin_profit_statistics(
     db: Session,
     coin: Optional[str] = None,
@@ -215,61 +516,56 @@ def get_coin_profit_statistics(
             - statistics: 코인별 통계 리스트
                 각 항목에는 다음이 포함됩니다:
                 - coin: 코인 심볼
-                - total_trades: 총 거래 횟수
+                - total_trades: 총 거래 횟수 (실행 상태와 무관하게 전체 거래)
                 - total_profit: 총 수익 (KRW, 성공한 거래만 집계)
                 - avg_profit: 평균 수익 (KRW, 성공한 거래만 집계)
     
     처리 과정:
-        1. LLMTradingExecution 테이블에서 성공한 거래만 조회
-        2. 코인별로 그룹화하여 집계
+        1. LLMTradingExecution 테이블에서 거래별 잔액 변화량 조회
+        2. 코인별로 그룹화하여 집계 (수익은 FILTER 절로 성공한 거래만 집계)
         3. 각 코인별 총 거래 횟수, 총 수익, 평균 수익 계산
         4. 필터링 조건(coin, start_date, end_date) 적용
     """
-    # 코인별 집계를 위한 쿼리 생성
-    # count: 총 거래 횟수
-    # sum: 총 수익 (성공한 거래만)
-    # avg: 평균 수익 (성공한 거래만)
-    query = db.query(
-        LLMTradingExecution.coin,
-        func.count(LLMTradingExecution.id).label("total_trades"),
-        # 성공한 거래의 잔액 변화량 합계
-        func.sum(
-            case(
-                (and_(
-                    LLMTradingExecution.balance_after.isnot(None),
-                    LLMTradingExecution.balance_before.isnot(None),
-                    LLMTradingExecution.execution_status == "success"
-                ),
-                LLMTradingExecution.balance_after - LLMTradingExecution.balance_before),
-                else_=Decimal("0")
-            )
-        ).label("total_profit"),
-        # 성공한 거래의 잔액 변화량 평균
-        func.avg(
-            case(
-                (and_(
-                    LLMTradingExecution.balance_after.isnot(None),
-                    LLMTradingExecution.balance_before.isnot(None),
-                    LLMTradingExecution.execution_status == "success"
-                ),
-                LLMTradingExecution.balance_after - LLMTradingExecution.balance_before),
-                else_=None
-            )
-        ).label("avg_profit"),
+    # 거래별 잔액 변화량을 서브쿼리에서 한 번만 계산 (전후 잔액 중 하나라도 없으면 NULL이 되어 집계에서 제외)
+    delta_query = db.query(
+        LLMTradingExecution.coin.label("coin"),
+        (LLMTradingExecution.balance_after - LLMTradingExecution.balance_before).label("delta"),
+        LLMTradingExecution.execution_status.label("execution_status"),
     )
     
     # 특정 코인으로 필터링
     if coin:
-        query = query.filter(LLMTradingExecution.coin == coin)
+        delta_query = delta_query.filter(LLMTradingExecution.coin == coin)
     # 시작 날짜로 필터링
     if start_date:
-        query = query.filter(LLMTradingExecution.executed_at >= start_date)
+        delta_query = delta_query.filter(LLMTradingExecution.executed_at >= start_date)
     # 종료 날짜로 필터링
     if end_date:
-        query = query.filter(LLMTradingExecution.executed_at <= end_date)
+        delta_query = delta_query.filter(LLMTradingExecution.executed_at <= end_date)
+    
+    # 조건에 맞는 거래가 없으면 그룹화 집계를 생략
+    if not _has_rows(db, delta_query):
+        return {
+            "coin": coin or "all",
+            "statistics": []
+        }
+    
+    deltas = delta_query.subquery()
+    
+    # 코인별 집계를 위한 쿼리 생성
+    # count: 총 거래 횟수
+    # sum: 총 수익 (성공한 거래만)
+    # avg: 평균 수익 (성공한 거래만)
+    is_success = deltas.c.execution_status == "success"
+    query = db.query(
+        deltas.c.coin,
+        func.count().label("total_trades"),
+        func.sum(deltas.c.delta).filter(is_success).label("total_profit"),
+        func.avg(deltas.c.delta).filter(is_success).label("avg_profit"),
+    )
     
     # 코인별로 그룹화하여 집계 결과 조회
-    results = query.group_by(LLMTradingExecution.coin).all()
+    results = query.group_by(deltas.c.coin).all()
     
     # 결과를 딕셔너리 리스트로 변환
     statistics = []
@@ -287,6 +583,7 @@ def get_coin_profit_statistics(
     }
 
 
+@_cached_statistics
 def get_model_profit_comparison(
     db: Session,
     start_date: Optional[datetime] = None,
@@ -308,49 +605,44 @@ def get_model_profit_comparison(
             각 딕셔너리에는 다음이 포함됩니다:
             - account_id: 계정 ID (문자열)
             - model_name: 모델명 (예: "google/gemma-3-27b-it")
-            - total_trades: 총 거래 횟수
+            - total_trades: 총 거래 횟수 (실행 상태와 무관하게 전체 거래)
             - total_profit: 총 수익 (KRW, 성공한 거래만 집계)
             - avg_profit: 평균 수익 (KRW, 성공한 거래만 집계)
     
     처리 과정:
-        1. LLMTradingExecution 테이블에서 성공한 거래만 조회
-        2. account_id별로 그룹화하여 집계
+        1. LLMTradingExecution 테이블에서 거래별 잔액 변화량 조회
+        2. account_id별로 그룹화하여 집계 (수익은 FILTER 절로 성공한 거래만 집계)
         3. 각 모델별 총 거래 횟수, 총 수익, 평균 수익 계산
         4. account_id를 모델명으로 변환하여 포함
     """
-    query = db.query(
-        LLMTradingExecution.account_id,
-        func.count(LLMTradingExecution.id).label("total_trades"),
-        func.sum(
-            case(
-                (and_(
-                    LLMTradingExecution.balance_after.isnot(None),
-                    LLMTradingExecution.balance_before.isnot(None),
-                    LLMTradingExecution.execution_status == "success"
-                ),
-                LLMTradingExecution.balance_after - LLMTradingExecution.balance_before),
-                else_=Decimal("0")
-            )
-        ).label("total_profit"),
-        func.avg(
-            case(
-                (and_(
-                    LLMTradingExecution.balance_after.isnot(None),
-                    LLMTradingExecution.balance_before.isnot(None),
-                    LLMTradingExecution.execution_status == "success"
-                ),
-                LLMTradingExecution.balance_after - LLMTradingExecution.balance_before),
-                else_=None
-            )
-        ).label("avg_profit"),
+    # 거래별 잔액 변화량을 서브쿼리에서 한 번만 계산 (전후 잔액 중 하나라도 없으면 NULL이 되어 집계에서 제외)
+    delta_query = db.query(
+        LLMTradingExecution.account_id.label("account_id"),
+        (LLMTradingExecution.balance_after - LLMTradingExecution.balance_before).label("delta"),
+        LLMTradingExecution.execution_status.label("execution_status"),
     )
     
     if start_date:
-        query = query.filter(LLMTradingExecution.executed_at >= start_date)
+        delta_query = delta_query.filter(LLMTradingExecution.executed_at >= start_date)
     if end_date:
-        query = query.filter(LLMTradingExecution.executed_at <= end_date)
+        delta_query = delta_query.filter(LLMTradingExecution.executed_at <= end_date)
+    
+    # 조건에 맞는 거래가 없으면 그룹화 집계를 생략
+    if not _has_rows(db, delta_query):
+        return []
+    
+    deltas = delta_query.subquery()
     
-    results = query.group_by(LLMTradingExecution.account_id).all()
+    # 성공한 거래만 집계하는 FILTER 절 (거래 횟수는 전체 기준)
+    is_success = deltas.c.execution_status == "success"
+    query = db.query(
+        deltas.c.account_id,
+        func.count().label("total_trades"),
+        func.sum(deltas.c.delta).filter(is_success).label("total_profit"),
+        func.avg(deltas.c.delta).filter(is_success).label("avg_profit"),
+    )
+    
+    results = query.group_by(deltas.c.account_id).all()
     
     model_stats = []
     for r in results:
@@ -397,63 +689,46 @@ def get_stop_loss_profit_target_achievement(
     
     처리 과정:
         1. LLMTradingSignal에서 stop_loss 또는 profit_target이 설정된 신호 조회
-        2. 각 신호에 대응하는 실행 기록(LLMTradingExecution) 조회
-        3. 실행 가격과 설정된 손절가/익절가 비교
+        2. 각 신호에 대응하는 실행 기록(LLMTradingExecution)을 JOIN (쿼리 한 번)
+        3. 실행 가격과 설정된 손절가/익절가를 SQL에서 비교하여 집계
         4. 손절가: 실행 가격 <= 손절가인 경우 달성
         5. 익절가: 실행 가격 >= 익절가인 경우 달성
         6. 달성 횟수와 총 거래 수를 기반으로 달성률 계산
     """
-    # 손절가 또는 익절가가 설정된 신호만 조회
-    signals_query = db.query(LLMTradingSignal).filter(
-        or_(
-            LLMTradingSignal.stop_loss.isnot(None),
-            LLMTradingSignal.profit_target.isnot(None)
-        )
+    # 손절가/익절가가 설정되어 있는지 (0은 설정되지 않은 것으로 간주)
+    stop_loss_set = and_(LLMTradingSignal.stop_loss.isnot(None), LLMTradingSignal.stop_loss != 0)
+    profit_target_set = and_(LLMTradingSignal.profit_target.isnot(None), LLMTradingSignal.profit_target != 0)
+    executed_price = LLMTradingExecution.executed_price
+    
+    # 신호와 대응하는 성공 실행 기록을 JOIN하여 달성 횟수와 총 거래 수를 한 번에 집계
+    # 손절가: 실행 가격 <= 손절가인 경우 달성, 익절가: 실행 가격 >= 익절가인 경우 달성
+    query = db.query(
+        func.sum(case((stop_loss_set, 1), else_=0)).label("stop_loss_total"),
+        func.sum(case((and_(stop_loss_set, executed_price <= LLMTradingSignal.stop_loss), 1), else_=0)).label("stop_loss_hit"),
+        func.sum(case((profit_target_set, 1), else_=0)).label("profit_target_total"),
+        func.sum(case((and_(profit_target_set, executed_price >= LLMTradingSignal.profit_target), 1), else_=0)).label("profit_target_hit"),
+    ).select_from(LLMTradingSignal).join(
+        LLMTradingExecution,
+        LLMTradingExecution.id == _matching_success_execution_id()
+    ).filter(
+        or_(stop_loss_set, profit_target_set),
+        # 실행 가격이 없으면 제외
+        executed_price.isnot(None),
+        executed_price != 0
     )
     
     # 계정 ID로 필터링
     if account_id:
-        signals_query = signals_query.filter(LLMTradingSignal.account_id == account_id)
+        query = query.filter(LLMTradingSignal.account_id == account_id)
     # 코인으로 필터링
     if coin:
-        signals_query = signals_query.filter(LLMTradingSignal.coin == coin)
-    
-    signals = signals_query.all()
-    
-    # 손절가/익절가 달성 통계 변수 초기화
-    stop_loss_hit = 0      # 손절가 달성 횟수
-    stop_loss_total = 0    # 손절가 설정된 총 거래 수
-    profit_target_hit = 0   # 익절가 달성 횟수
-    profit_target_total = 0 # 익절가 설정된 총 거래 수
-    
-    # 각 신호에 대해 실행 기록 확인
-    for signal in signals:
-        # 해당 신호의 실행 기록 조회 (성공한 거래만)
-        execution = db.query(LLMTradingExecution).filter(
-            LLMTradingExecution.prompt_id == signal.prompt_id,
-            LLMTradingExecution.coin == signal.coin,
-            LLMTradingExecution.execution_status == "success"
-        ).first()
-        
-        # 실행 기록이 없거나 실행 가격이 없으면 건너뛰기
-        if not execution or not execution.executed_price:
-            continue
-        
-        executed_price = float(execution.executed_price)
-        
-        # 손절가 달성 여부 확인
-        if signal.stop_loss:
-            stop_loss_total += 1
-            # 실행 가격이 손절가 이하이면 손절가 달성
-            if executed_price <= float(signal.stop_loss):
-                stop_loss_hit += 1
-        
-        # 익절가 달성 여부 확인
-        if signal.profit_target:
-            profit_target_total += 1
-            # 실행 가격이 익절가 이상이면 익절가 달성
-            if executed_price >= float(signal.profit_target):
-                profit_target_hit += 1
+        query = query.filter(LLMTradingSignal.coin == coin)
+    
+    counts = query.one()
+    stop_loss_hit = counts.stop_loss_hit or 0           # 손절가 달성 횟수
+    stop_loss_total = counts.stop_loss_total or 0       # 손절가 설정된 총 거래 수
+    profit_target_hit = counts.profit_target_hit or 0   # 익절가 달성 횟수
+    profit_target_total = counts.profit_target_total or 0 # 익절가 설정된 총 거래 수
     
     # 결과 반환
     return {
@@ -472,6 +747,7 @@ def get_stop_loss_profit_target_achievement(
 
 # ==================== 자산 통계 ====================
 
+@_cached_statistics
 def get_total_asset_trend(
     db: Session,
     account_id: Optional[UUID] = None,
@@ -507,34 +783,45 @@ def get_total_asset_trend(
     """
     start_date = datetime.now(timezone.utc) - timedelta(days=days)
     
-    query = db.query(AccountInformation).filter(
+    # ORM 객체 대신 응답에 필요한 컬럼만 튜플로 조회
+    query = db.query(
+        AccountInformation.user_id,
+        AccountInformation.username,
+        AccountInformation.model_name,
+        AccountInformation.total,
+        AccountInformation.btc,
+        AccountInformation.eth,
+        AccountInformation.doge,
+        AccountInformation.sol,
+        AccountInformation.xrp,
+        AccountInformation.krw,
+        AccountInformation.created_at,
+    ).filter(
         AccountInformation.created_at >= start_date
     )
     
-    if account_id:
-        user_id = _get_user_id_from_account_id(account_id)
-        if user_id:
-            query = query.filter(AccountInformation.user_id == str(user_id))
+    user_id = _get_account_information_user_id(account_id)
+    if user_id:
+        query = query.filter(AccountInformation.user_id == user_id)
     
     records = query.order_by(AccountInformation.created_at).all()
     
-    results = []
-    for record in records:
-        results.append({
-            "user_id": record.user_id,
-            "username": record.username,
-            "model_name": record.model_name,
-            "total": float(record.total) if record.total else 0,
-            "btc": float(record.btc) if record.btc else 0,
-            "eth": float(record.eth) if record.eth else 0,
-            "doge": float(record.doge) if record.doge else 0,
-            "sol": float(record.sol) if record.sol else 0,
-            "xrp": float(record.xrp) if record.xrp else 0,
-            "krw": float(record.krw) if record.krw else 0,
-            "created_at": record.created_at.isoformat() if record.created_at else None,
-        })
-    
-    return results
+    return [
+        {
+            "user_id": user_id,
+            "username": username,
+            "model_name": model_name,
+            "total": float(total) if total else 0,
+            "btc": float(btc) if btc else 0,
+            "eth": float(eth) if eth else 0,
+            "doge": float(doge) if doge else 0,
+            "sol": float(sol) if sol else 0,
+            "xrp": float(xrp) if xrp else 0,
+            "krw": float(krw) if krw else 0,
+            "created_at": created_at.isoformat() if created_at else None,
+        }
+        for (user_id, username, model_name, total, btc, eth, doge, sol, xrp, krw, created_at) in records
+    ]
 
 
 def get_coin_holdings_distribution(
@@ -573,39 +860,11 @@ def get_coin_holdings_distribution(
         3. 보유 금액이 0보다 큰 코인만 포함
         4. 각 코인의 총 자산 대비 비중(%) 계산
     """
-    if not date:
-        date = datetime.now(timezone.utc)
+    date = date or datetime.now(timezone.utc)
     
-    query = db.query(AccountInformation).filter(
-        AccountInformation.created_at <= date
-    )
+    user_id = _get_account_information_user_id(account_id)
     
-    if account_id:
-        user_id = _get_user_id_from_account_id(account_id)
-        if user_id:
-            query = query.filter(AccountInformation.user_id == str(user_id))
-    
-    subquery = (
-        db.query(
-            AccountInformation.user_id,
-            func.max(AccountInformation.created_at).label("max_created_at")
-        )
-        .filter(AccountInformation.created_at <= date)
-        .group_by(AccountInformation.user_id)
-        .subquery()
-    )
-    
-    records = (
-        db.query(AccountInformation)
-        .join(
-            subquery,
-            and_(
-                AccountInformation.user_id == subquery.c.user_id,
-                AccountInformation.created_at == subquery.c.max_created_at
-            )
-        )
-        .all()
-    )
+    records = _latest_account_information_query(db, date, user_id).all()
     
     all_holdings = []
     for record in records:
@@ -642,6 +901,7 @@ def get_coin_holdings_distribution(
     }
 
 
+@_cached_statistics
 def get_hourly_asset_changes(
     db: Session,
     account_id: Optional[UUID] = None,
@@ -689,10 +949,9 @@ def get_hourly_asset_changes(
         AccountInformation.created_at >= start_date
     )
     
-    if account_id:
-        user_id = _get_user_id_from_account_id(account_id)
-        if user_id:
-            query = query.filter(AccountInformation.user_id == str(user_id))
+    user_id = _get_account_information_user_id(account_id)
+    if user_id:
+        query = query.filter(AccountInformation.user_id == user_id)
     
     results = query.group_by(
         func.date_trunc('hour', AccountInformation.created_at),
@@ -713,6 +972,7 @@ def get_hourly_asset_changes(
     ]
 
 
+@_cached_statistics
 def get_model_asset_comparison(
     db: Session,
     date: Optional[datetime] = None
@@ -743,30 +1003,11 @@ def get_model_asset_comparison(
         2. 각 계정의 자산 정보를 딕셔너리로 변환
         3. 모든 계정의 정보를 리스트로 반환
     """
-    if not date:
-        date = datetime.now(timezone.utc)
+    date = date or datetime.now(timezone.utc)
+    # 모든 행에 같은 조회 시점이 들어가므로 문자열 변환은 한 번만 수행
+    date_iso = date.isoformat()
     
-    subquery = (
-        db.query(
-            AccountInformation.user_id,
-            func.max(AccountInformation.created_at).label("max_created_at")
-        )
-        .filter(AccountInformation.created_at <= date)
-        .group_by(AccountInformation.user_id)
-        .subquery()
-    )
-    
-    records = (
-        db.query(AccountInformation)
-        .join(
-            subquery,
-            and_(
-                AccountInformation.user_id == subquery.c.user_id,
-                AccountInformation.created_at == subquery.c.max_created_at
-            )
-        )
-        .all()
-    )
+    records = _latest_account_information_query(db, date).all()
     
     return [
         {
@@ -780,7 +1021,7 @@ def get_model_asset_comparison(
             "sol": float(r.sol) if r.sol else 0,
             "xrp": float(r.xrp) if r.xrp else 0,
             "krw": float(r.krw) if r.krw else 0,
-            "date": date.isoformat(),
+            "date": date_iso,
         }
         for r in records
     ]
@@ -826,10 +1067,9 @@ def get_max_profit_loss(
     
     처리 과정:
         1. 성공한 거래 중 잔액 정보가 있는 거래만 조회
-        2. 각 거래의 잔액 변화량 계산 (balance_after - balance_before)
-        3. 변화량이 양수면 수익, 음수면 손실로 분류
-        4. 수익 거래 중 최대값, 손실 거래 중 최대값(절댓값) 찾기
-        5. 통계 정보와 함께 반환
+        2. 잔액 변화량(balance_after - balance_before)이 양수면 수익, 음수면 손실로 SQL에서 집계
+        3. 변화량 기준 정렬로 최대 수익 거래와 최대 손실 거래(절댓값)를 한 건씩 조회
+        4. 통계 정보와 함께 반환
     """
     query = db.query(LLMTradingExecution).filter(
         LLMTradingExecution.execution_status == "success",
@@ -842,50 +1082,67 @@ def get_max_profit_loss(
     if coin:
         query = query.filter(LLMTradingExecution.coin == coin)
     
-    executions = query.all()
+    # 조건에 맞는 거래가 없으면 집계/정렬 조회를 생략
+    if not _has_rows(db, query):
+        return {
+            "max_profit": None,
+            "max_loss": None,
+            "total_profits": 0,
+            "total_losses": 0,
+            "total_trades": 0,
+        }
     
-    profits = []
-    losses = []
+    change_expr = LLMTradingExecution.balance_after - LLMTradingExecution.balance_before
+    
+    # 수익/손실/전체 거래 수는 SQL에서 집계
+    counts = query.with_entities(
+        func.count().label("total_trades"),
+        func.sum(case((change_expr > 0, 1), else_=0)).label("total_profits"),
+        func.sum(case((change_expr < 0, 1), else_=0)).label("total_losses"),
+    ).one()
+    
+    # 최대 수익/손실 거래는 변화량 정렬 후 한 건씩만 조회 (동률이면 먼저 저장된 거래)
+    profit_exec = query.filter(change_expr > 0).order_by(desc(change_expr), LLMTradingExecution.id).first()
+    loss_exec = query.filter(change_expr < 0).order_by(change_expr, LLMTradingExecution.id).first()
+    
+    max_profit = None
+    if profit_exec:
+        change = float(profit_exec.balance_after - profit_exec.balance_before)
+        max_profit = {
+            "execution_id": profit_exec.id,
+            "account_id": str(profit_exec.account_id) if profit_exec.account_id else None,
+            "model_name": _get_model_name_from_account_id(profit_exec.account_id),
+            "coin": profit_exec.coin,
+            "profit": change,
+            "profit_rate": float((change / float(profit_exec.balance_before)) * 100) if profit_exec.balance_before > 0 else None,
+            "executed_at": profit_exec.executed_at.isoformat() if profit_exec.executed_at else None,
+        }
     
-    for exec in executions:
-        change = float(exec.balance_after - exec.balance_before)
-        model_name = _get_model_name_from_account_id(exec.account_id)
-        
-        if change > 0:
-            profits.append({
-                "execution_id": exec.id,
-                "account_id": str(exec.account_id) if exec.account_id else None,
-                "model_name": model_name,
-                "coin": exec.coin,
-                "profit": change,
-                "profit_rate": float((change / float(exec.balance_before)) * 100) if exec.balance_before > 0 else None,
-                "executed_at": exec.executed_at.isoformat() if exec.executed_at else None,
-            })
-        elif change < 0:
-            losses.append({
-                "execution_id": exec.id,
-                "account_id": str(exec.account_id) if exec.account_id else None,
-                "model_name": model_name,
-                "coin": exec.coin,
-                "loss": abs(change),
-                "loss_rate": float((abs(change) / float(exec.balance_before)) * 100) if exec.balance_before > 0 else None,
-                "executed_at": exec.executed_at.isoformat() if exec.executed_at else None,
-            })
-    
-    max_profit = max(profits, key=lambda x: x["profit"]) if profits else None
-    max_loss = max(losses, key=lambda x: x["loss"]) if losses else None
+    max_loss = None
+    if loss_exec:
+        change = float(loss_exec.balance_after - loss_exec.balance_before)
+        max_loss = {
+            "execution_id": loss_exec.id,
+            "account_id": str(loss_exec.account_id) if loss_exec.account_id else None,
+            "model_name": _get_model_name_from_account_id(loss_exec.account_id),
+            "coin": loss_exec.coin,
+            "loss": abs(change),
+            "loss_rate": float((abs(change) / float(loss_exec.balance_before)) * 100) if loss_exec.balance_before > 0 else None,
+            "executed_at": loss_exec.executed_at.isoformat() if loss_exec.executed_at else None,
+        }
     
     return {
         "max_profit": max_profit,
         "max_loss": max_loss,
-        "total_profits": len(profits),
-        "total_losses": len(losses),
-        "total_trades": len(executions),
+        "total_profits": counts.total_profits or 0,
+        "total_losses": counts.total_losses or 0,
+        "total_trades": counts.total_trades,
     }
 
 
 # ==================== 리스크 관리 통계 ====================
 
+@_cached_statistics
 def get_stop_loss_achievement_rate(
     db: Session,
     account_id: Optional[UUID] = None,
@@ -917,58 +1174,65 @@ def get_stop_loss_achievement_rate(
     
     처리 과정:
         1. LLMTradingSignal에서 stop_loss가 설정된 신호 조회
-        2. 각 신호에 대응하는 실행 기록(LLMTradingExecution) 조회
+        2. 각 신호에 대응하는 실행 기록(LLMTradingExecution)을 JOIN
         3. 실행 가격이 손절가 이하인지 확인 (executed_price <= stop_loss)
-        4. 달성 횟수와 총 거래 수를 기반으로 달성률 계산
-        5. 상세 정보는 최대 10개만 반환하여 성능 최적화
+        4. 달성 횟수와 총 거래 수를 SQL에서 집계하여 달성률 계산
+        5. 상세 정보는 최대 10개만 조회하여 성능 최적화
     """
-    signals_query = db.query(LLMTradingSignal).filter(
-        LLMTradingSignal.stop_loss.isnot(None)
+    # 신호와 대응하는 성공 실행 기록을 JOIN (실행 가격이 없으면 제외)
+    executed_price = LLMTradingExecution.executed_price
+    hit = executed_price <= LLMTradingSignal.stop_loss
+    base_query = db.query(LLMTradingSignal).join(
+        LLMTradingExecution,
+        LLMTradingExecution.id == _matching_success_execution_id()
+    ).filter(
+        LLMTradingSignal.stop_loss.isnot(None),
+        executed_price.isnot(None),
+        executed_price != 0
     )
     
     if account_id:
-        signals_query = signals_query.filter(LLMTradingSignal.account_id == account_id)
+        base_query = base_query.filter(LLMTradingSignal.account_id == account_id)
     if coin:
-        signals_query = signals_query.filter(LLMTradingSignal.coin == coin)
-    
-    signals = signals_query.all()
-    
-    hit_count = 0
-    total_count = 0
-    details = []
+        base_query = base_query.filter(LLMTradingSignal.coin == coin)
+    
+    # 달성 횟수와 총 거래 수는 SQL에서 집계
+    counts = base_query.with_entities(
+        func.count().label("total_count"),
+        func.count().filter(hit).label("hit_count"),
+    ).one()
+    hit_count = counts.hit_count or 0
+    total_count = counts.total_count or 0
+    
+    # 상세 정보는 최대 10개만 조회 (가격은 float으로, 달성 여부는 SQL에서 계산)
+    detail_rows = base_query.with_entities(
+        LLMTradingSignal.id,
+        LLMTradingSignal.coin,
+        cast(LLMTradingSignal.stop_loss, Float),
+        cast(executed_price, Float),
+        hit.label("hit"),
+    ).order_by(LLMTradingSignal.id).limit(10).all()
     
-    for signal in signals:
-        execution = db.query(LLMTradingExecution).filter(
-            LLMTradingExecution.prompt_id == signal.prompt_id,
-            LLMTradingExecution.coin == signal.coin,
-            LLMTradingExecution.execution_status == "success"
-        ).first()
-        
-        if execution and execution.executed_price:
-            total_count += 1
-            executed_price = float(execution.executed_price)
-            stop_loss_price = float(signal.stop_loss)
-            hit = executed_price <= stop_loss_price
-            
-            if hit:
-                hit_count += 1
-            
-            details.append({
-                "signal_id": signal.id,
-                "coin": signal.coin,
-                "stop_loss": stop_loss_price,
-                "executed_price": executed_price,
-                "hit": hit,
-            })
+    details = [
+        {
+            "signal_id": signal_id,
+            "coin": signal_coin,
+            "stop_loss": stop_loss,
+            "executed_price": signal_executed_price,
+            "hit": signal_hit,
+        }
+        for signal_id, signal_coin, stop_loss, signal_executed_price, signal_hit in detail_rows
+    ]
     
     return {
         "hit_count": hit_count,
         "total_count": total_count,
         "achievement_rate": (hit_count / total_count * 100) if total_count > 0 else 0,
-        "details": details[:10]  # 최대 10개만 반환
+        "details": details  # 최대 10개만 반환
     }
 
 
+@_cached_statistics
 def get_profit_target_achievement_rate(
     db: Session,
     account_id: Optional[UUID] = None,
@@ -1000,60 +1264,67 @@ def get_profit_target_achievement_rate(
     
     처리 과정:
         1. LLMTradingSignal에서 profit_target이 설정된 신호 조회
-        2. 각 신호에 대응하는 실행 기록(LLMTradingExecution) 조회
+        2. 각 신호에 대응하는 실행 기록(LLMTradingExecution)을 JOIN
         3. 실행 가격이 익절가 이상인지 확인 (executed_price >= profit_target)
-        4. 달성 횟수와 총 거래 수를 기반으로 달성률 계산
-        5. 상세 정보는 최대 10개만 반환하여 성능 최적화
+        4. 달성 횟수와 총 거래 수를 SQL에서 집계하여 달성률 계산
+        5. 상세 정보는 최대 10개만 조회하여 성능 최적화
     """
-    signals_query = db.query(LLMTradingSignal).filter(
-        LLMTradingSignal.profit_target.isnot(None)
+    # 신호와 대응하는 성공 실행 기록을 JOIN (실행 가격이 없으면 제외)
+    executed_price = LLMTradingExecution.executed_price
+    hit = executed_price >= LLMTradingSignal.profit_target
+    base_query = db.query(LLMTradingSignal).join(
+        LLMTradingExecution,
+        LLMTradingExecution.id == _matching_success_execution_id()
+    ).filter(
+        LLMTradingSignal.profit_target.isnot(None),
+        executed_price.isnot(None),
+        executed_price != 0
     )
     
     if account_id:
-        signals_query = signals_query.filter(LLMTradingSignal.account_id == account_id)
+        base_query = base_query.filter(LLMTradingSignal.account_id == account_id)
     if coin:
-        signals_query = signals_query.filter(LLMTradingSignal.coin == coin)
-    
-    signals = signals_query.all()
-    
-    hit_count = 0
-    total_count = 0
-    details = []
+        base_query = base_query.filter(LLMTradingSignal.coin == coin)
+    
+    # 달성 횟수와 총 거래 수는 SQL에서 집계
+    counts = base_query.with_entities(
+        func.count().label("total_count"),
+        func.count().filter(hit).label("hit_count"),
+    ).one()
+    hit_count = counts.hit_count or 0
+    total_count = counts.total_count or 0
+    
+    # 상세 정보는 최대 10개만 조회 (가격은 float으로, 달성 여부는 SQL에서 계산)
+    detail_rows = base_query.with_entities(
+        LLMTradingSignal.id,
+        LLMTradingSignal.coin,
+        cast(LLMTradingSignal.profit_target, Float),
+        cast(executed_price, Float),
+        hit.label("hit"),
+    ).order_by(LLMTradingSignal.id).limit(10).all()
     
-    for signal in signals:
-        execution = db.query(LLMTradingExecution).filter(
-            LLMTradingExecution.prompt_id == signal.prompt_id,
-            LLMTradingExecution.coin == signal.coin,
-            LLMTradingExecution.execution_status == "success"
-        ).first()
-        
-        if execution and execution.executed_price:
-            total_count += 1
-            executed_price = float(execution.executed_price)
-            profit_target_price = float(signal.profit_target)
-            hit = executed_price >= profit_target_price
-            
-            if hit:
-                hit_count += 1
-            
-            details.append({
-                "signal_id": signal.id,
-                "coin": signal.coin,
-                "profit_target": profit_target_price,
-                "executed_price": executed_price,
-                "hit": hit,
-            })
+    details = [
+        {
+            "signal_id": signal_id,
+            "coin": signal_coin,
+            "profit_target": profit_target,
+            "executed_price": signal_executed_price,
+            "hit": signal_hit,
+        }
+        for signal_id, signal_coin, profit_target, signal_executed_price, signal_hit in detail_rows
+    ]
     
     return {
         "hit_count": hit_count,
         "total_count": total_count,
         "achievement_rate": (hit_count / total_count * 100) if total_count > 0 else 0,
-        "details": details[:10]  # 최대 10개만 반환
+        "details": details  # 최대 10개만 반환
     }
 
 
 # ==================== 모델별 통계 ====================
 
+@_cached_statistics
 def get_model_avg_profit_rate(
     db: Session,
     start_date: Optional[datetime] = None,
@@ -1086,59 +1357,51 @@ def get_model_avg_profit_rate(
         3. 각 모델별로 거래 횟수, 총 수익, 평균 수익률 계산
         4. account_id를 모델명으로 변환하여 포함
     """
-    query = db.query(
+    # ORM Query 대신 Core select로 조회하여 행 변환 오버헤드 없이 매핑으로 결과를 받음
+    # lambda_stmt로 감싸 호출마다 SQL 구문 트리를 다시 만들고 컴파일하지 않도록 캐시
+    # 합계/평균은 CASE 대신 FILTER (WHERE ...) 절로 잔액 정보가 있는 거래만 집계
+    has_balances = and_(
+        LLMTradingExecution.balance_after.isnot(None),
+        LLMTradingExecution.balance_before.isnot(None)
+    )
+    query = lambda_stmt(lambda: select(
         LLMTradingExecution.account_id,
         func.count(LLMTradingExecution.id).label("trade_count"),
         func.sum(
-            case(
-                (and_(
-                    LLMTradingExecution.balance_after.isnot(None),
-                    LLMTradingExecution.balance_before.isnot(None),
-                    LLMTradingExecution.execution_status == "success"
-                ),
-                LLMTradingExecution.balance_after - LLMTradingExecution.balance_before),
-                else_=Decimal("0")
-            )
-        ).label("total_profit"),
+            LLMTradingExecution.balance_after - LLMTradingExecution.balance_before
+        ).filter(has_balances).label("total_profit"),
         func.avg(
-            case(
-                (and_(
-                    LLMTradingExecution.balance_after.isnot(None),
-                    LLMTradingExecution.balance_before.isnot(None),
-                    LLMTradingExecution.execution_status == "success",
-                    LLMTradingExecution.balance_before > 0
-                ),
-                (LLMTradingExecution.balance_after - LLMTradingExecution.balance_before) / 
-                LLMTradingExecution.balance_before * 100),
-                else_=None
-            )
-        ).label("avg_profit_rate"),
-    ).filter(
+            (LLMTradingExecution.balance_after - LLMTradingExecution.balance_before) /
+            LLMTradingExecution.balance_before * 100
+        ).filter(and_(has_balances, LLMTradingExecution.balance_before > 0)).label("avg_profit_rate"),
+    ).where(
         LLMTradingExecution.execution_status == "success"
-    )
+    ))
     
     if start_date:
-        query = query.filter(LLMTradingExecution.executed_at >= start_date)
+        query += lambda s: s.where(LLMTradingExecution.executed_at >= start_date)
     if end_date:
-        query = query.filter(LLMTradingExecution.executed_at <= end_date)
+        query += lambda s: s.where(LLMTradingExecution.executed_at <= end_date)
+    query += lambda s: s.group_by(LLMTradingExecution.account_id)
     
-    results = query.group_by(LLMTradingExecution.account_id).all()
+    results = db.execute(query).mappings().all()
     
     model_stats = []
     for r in results:
-        model_name = _get_model_name_from_account_id(r.account_id)
+        model_name = _get_model_name_from_account_id(r["account_id"])
         
         model_stats.append({
-            "account_id": str(r.account_id) if r.account_id else None,
+            "account_id": str(r["account_id"]) if r["account_id"] else None,
             "model_name": model_name,
-            "trade_count": r.trade_count,
-            "total_profit": float(r.total_profit) if r.total_profit else 0,
-            "avg_profit_rate": float(r.avg_profit_rate) if r.avg_profit_rate else None,
+            "trade_count": r["trade_count"],
+            "total_profit": float(r["total_profit"]) if r["total_profit"] else 0,
+            "avg_profit_rate": float(r["avg_profit_rate"]) if r["avg_profit_rate"] else None,
         })
     
     return model_stats
 
 
+@_cached_statistics
 def get_model_confidence_distribution(
     db: Session,
     account_id: Optional[UUID] = None
@@ -1147,7 +1410,7 @@ def get_model_confidence_distribution(
     모델별 신뢰도 분포를 조회하는 함수
     
     각 LLM 모델이 거래 신호를 생성할 때 표현한 신뢰도(confidence)의
-    통계적 분포를 계산합니다. 평균, 최소, 최대, 표준편차를 포함하여
+    통계적 분포를 계산합니다. 평균, 최소, 최대, 표준편차와 백분위수(10/50/90)를 포함하여
     모델의 신뢰도 패턴을 분석할 수 있습니다.
     
     Args:
@@ -1165,46 +1428,59 @@ def get_model_confidence_distribution(
                 - min_confidence: 최소 신뢰도
                 - max_confidence: 최대 신뢰도
                 - std_confidence: 신뢰도 표준편차
+                - median_confidence: 신뢰도 중앙값
+                - p10_confidence: 신뢰도 하위 10% 백분위수
+                - p90_confidence: 신뢰도 상위 10% 백분위수 (90번째 백분위수)
     
     처리 과정:
         1. LLMTradingSignal에서 confidence가 설정된 신호만 조회
         2. account_id별로 그룹화
-        3. 각 모델별로 신뢰도의 통계값(평균, 최소, 최대, 표준편차) 계산
+        3. 각 모델별로 신뢰도의 통계값(평균, 최소, 최대, 표준편차, 백분위수)을 한 번의 집계로 계산
         4. account_id를 모델명으로 변환하여 포함
     """
-    query = db.query(
+    # 백분위수는 같은 정렬 기준(confidence 오름차순)을 쓰므로 PostgreSQL이 한 번의 정렬로 함께 계산
+    # lambda_stmt로 감싸 호출마다 SQL 구문 트리를 다시 만들고 컴파일하지 않도록 캐시
+    query = lambda_stmt(lambda: select(
         LLMTradingSignal.account_id,
         func.count(LLMTradingSignal.id).label("total_signals"),
         func.avg(LLMTradingSignal.confidence).label("avg_confidence"),
         func.min(LLMTradingSignal.confidence).label("min_confidence"),
         func.max(LLMTradingSignal.confidence).label("max_confidence"),
         func.stddev(LLMTradingSignal.confidence).label("std_confidence"),
-    ).filter(
+        func.percentile_cont(0.5).within_group(LLMTradingSignal.confidence.asc()).label("median_confidence"),
+        func.percentile_cont(0.1).within_group(LLMTradingSignal.confidence.asc()).label("p10_confidence"),
+        func.percentile_cont(0.9).within_group(LLMTradingSignal.confidence.asc()).label("p90_confidence"),
+    ).where(
         LLMTradingSignal.confidence.isnot(None)
-    )
+    ))
     
     if account_id:
-        query = query.filter(LLMTradingSignal.account_id == account_id)
+        query += lambda s: s.where(LLMTradingSignal.account_id == account_id)
+    query += lambda s: s.group_by(LLMTradingSignal.account_id)
     
-    results = query.group_by(LLMTradingSignal.account_id).all()
+    results = db.execute(query).mappings().all()
     
     distributions = []
     for r in results:
-        model_name = _get_model_name_from_account_id(r.account_id)
+        model_name = _get_model_name_from_account_id(r["account_id"])
         
         distributions.append({
-            "account_id": str(r.account_id) if r.account_id else None,
+            "account_id": str(r["account_id"]) if r["account_id"] else None,
             "model_name": model_name,
-            "total_signals": r.total_signals,
-            "avg_confidence": float(r.avg_confidence) if r.avg_confidence else None,
-            "min_confidence": float(r.min_confidence) if r.min_confidence else None,
-            "max_confidence": float(r.max_confidence) if r.max_confidence else None,
-            "std_confidence": float(r.std_confidence) if r.std_confidence else None,
+            "total_signals": r["total_signals"],
+            "avg_confidence": float(r["avg_confidence"]) if r["avg_confidence"] else None,
+            "min_confidence": float(r["min_confidence"]) if r["min_confidence"] else None,
+            "max_confidence": float(r["max_confidence"]) if r["max_confidence"] else None,
+            "std_confidence": float(r["std_confidence"]) if r["std_confidence"] else None,
+            "median_confidence": float(r["median_confidence"]) if r["median_confidence"] else None,
+            "p10_confidence": float(r["p10_confidence"]) if r["p10_confidence"] else None,
+            "p90_confidence": float(r["p90_confidence"]) if r["p90_confidence"] else None,
         })
     
     return {"distributions": distributions}
 
 
+@_cached_statistics
 def get_model_preferred_coins(
     db: Session,
     account_id: Optional[UUID] = None
@@ -1235,29 +1511,31 @@ def get_model_preferred_coins(
         3. 신호 개수 기준으로 내림차순 정렬
         4. account_id를 모델명으로 변환하여 포함
     """
-    query = db.query(
+    # lambda_stmt로 감싸 호출마다 SQL 구문 트리를 다시 만들고 컴파일하지 않도록 캐시
+    query = lambda_stmt(lambda: select(
         LLMTradingSignal.account_id,
         LLMTradingSignal.coin,
         func.count(LLMTradingSignal.id).label("signal_count"),
-    )
+    ))
     
     if account_id:
-        query = query.filter(LLMTradingSignal.account_id == account_id)
-    
-    results = query.group_by(
+        query += lambda s: s.where(LLMTradingSignal.account_id == account_id)
+    query += lambda s: s.group_by(
         LLMTradingSignal.account_id,
         LLMTradingSignal.coin
-    ).order_by(desc("signal_count")).all()
+    ).order_by(desc("signal_count"))
+    
+    results = db.execute(query).mappings().all()
     
     preferred_coins = []
     for r in results:
-        model_name = _get_model_name_from_account_id(r.account_id)
+        model_name = _get_model_name_from_account_id(r["account_id"])
         
         preferred_coins.append({
-            "account_id": str(r.account_id) if r.account_id else None,
+            "account_id": str(r["account_id"]) if r["account_id"] else None,
             "model_name": model_name,
-            "coin": r.coin,
-            "signal_count": r.signal_count,
+            "coin": r["coin"],
+            "signal_count": r["signal_count"],
         })
     
     return preferred_coins
@@ -1265,6 +1543,7 @@ def get_model_preferred_coins(
 
 # ==================== 기술 지표 vs 수익률 상관관계 ====================
 
+@_cached_statistics
 def get_indicator_profit_correlation(
     db: Session,
     coin: str,
@@ -1303,18 +1582,52 @@ def get_indicator_profit_correlation(
     
     처리 과정:
         1. 지정된 코인의 성공한 거래 실행 기록 조회
-        2. 각 거래 실행 시점 이전의 최신 기술 지표 값 조회
-        3. 거래 전후 잔액을 기반으로 수익률 계산
+        2. 각 거래 실행 시점 이전의 최신 기술 지표를 JOIN으로 함께 조회
+        3. 거래 전후 잔액을 기반으로 수익률을 SQL에서 계산
         4. 지표 값과 수익률을 매칭하여 반환
         5. 지표 값이나 수익률이 없는 경우 제외
     """
-    # 지정된 코인의 성공한 거래 실행 기록 조회
-    # 잔액 정보가 모두 있어야 수익률 계산 가능
-    executions = db.query(LLMTradingExecution).filter(
+    # 요청한 지표 컬럼 하나만 조회 (지원하지 않는 지표 타입이면 매칭할 값이 없으므로 빈 결과)
+    indicator_column = _INDICATOR_COLUMNS.get(indicator_type)
+    if indicator_column is None:
+        logger.warning(f"⚠️ 지원하지 않는 지표 타입입니다: {indicator_type}")
+        return []
+    
+    # 거래 실행 시각 이전의 최신 기술 지표 ID (실행 기록마다 평가되는 상관 서브쿼리)
+    # market 형식: "KRW-BTC", "KRW-ETH" 등
+    latest_indicator_id = (
+        select(UpbitIndicators.id)
+        .where(
+            UpbitIndicators.market == f"KRW-{coin}",
+            UpbitIndicators.candle_date_time_utc <= LLMTradingExecution.executed_at
+        )
+        .order_by(desc(UpbitIndicators.candle_date_time_utc), desc(UpbitIndicators.id))
+        .limit(1)
+        .correlate(LLMTradingExecution)
+        .scalar_subquery()
+    )
+    
+    # 지정된 코인의 성공한 거래 실행 기록과 그 시점의 기술 지표를 JOIN으로 한 번에 조회
+    # 잔액 정보가 모두 있어야 수익률 계산 가능, 실행 시각이나 지표 데이터가 없으면 JOIN에서 제외
+    # 수익률은 SQL에서 계산: ((거래 후 잔액 - 거래 전 잔액) / 거래 전 잔액) * 100 (거래 전 잔액이 양수인 경우만)
+    executions = db.query(
+        LLMTradingExecution.id,
+        LLMTradingExecution.executed_at,
+        cast(indicator_column, Float).label("indicator_value"),
+        cast(
+            (LLMTradingExecution.balance_after - LLMTradingExecution.balance_before)
+            / LLMTradingExecution.balance_before * 100,
+            Float
+        ).label("profit_rate"),
+    ).join(
+        UpbitIndicators,
+        UpbitIndicators.id == latest_indicator_id
+    ).filter(
         LLMTradingExecution.coin == coin,
         LLMTradingExecution.execution_status == "success",
-        LLMTradingExecution.balance_before.isnot(None),
+        LLMTradingExecution.balance_before > 0,
         LLMTradingExecution.balance_after.isnot(None),
+        LLMTradingExecution.balance_after != 0,
     )
     
     # 시작 날짜로 필터링
@@ -1324,62 +1637,13 @@ def get_indicator_profit_correlation(
     if end_date:
         executions = executions.filter(LLMTradingExecution.executed_at <= end_date)
     
-    # 모든 실행 기록 조회
-    executions = executions.all()
-    
-    correlations = []
-    # 각 거래 실행 기록에 대해 기술 지표 값과 수익률 매칭
-    for exec in executions:
-        # 실행 시각이 없으면 건너뛰기
-        if not exec.executed_at:
-            continue
-        
-        # 거래 실행 시각 이전의 최신 기술 지표 값 조회
-        # market 형식: "KRW-BTC", "KRW-ETH" 등
-        indicator = db.query(UpbitIndicators).filter(
-            UpbitIndicators.market == f"KRW-{coin}",
-            UpbitIndicators.candle_date_time_utc <= exec.executed_at
-        ).order_by(desc(UpbitIndicators.candle_date_time_utc)).first()
-        
-        # 기술 지표 데이터가 없으면 건너뛰기
-        if not indicator:
-            continue
-        
-        # 수익률 계산: ((거래 후 잔액 - 거래 전 잔액) / 거래 전 잔액) * 100
-        profit_rate = None
-        if exec.balance_before and exec.balance_after and exec.balance_before > 0:
-            profit_rate = float((exec.balance_after - exec.balance_before) / exec.balance_before * 100)
-        
-        # 지정된 지표 타입에 해당하는 지표 값 추출
-        indicator_value = None
-        if indicator_type == "rsi14":
-            indicator_value = float(indicator.rsi14) if indicator.rsi14 else None
-        elif indicator_type == "macd":
-            indicator_value = float(indicator.macd) if indicator.macd else None
-        elif indicator_type == "macd_hist":
-            indicator_value = float(indicator.macd_hist) if indicator.macd_hist else None
-        elif indicator_type == "ema12":
-            indicator_value = float(indicator.ema12) if indicator.ema12 else None
-        elif indicator_type == "ema20":
-            indicator_value = float(indicator.ema20) if indicator.ema20 else None
-        elif indicator_type == "ema26":
-            indicator_value = float(indicator.ema26) if indicator.ema26 else None
-        elif indicator_type == "ema50":
-            indicator_value = float(indicator.ema50) if indicator.ema50 else None
-        elif indicator_type == "atr3":
-            indicator_value = float(indicator.atr3) if indicator.atr3 else None
-        elif indicator_type == "atr14":
-            indicator_value = float(indicator.atr14) if indicator.atr14 else None
-        
-        # 지표 값과 수익률이 모두 있는 경우에만 결과에 추가
-        if indicator_value is not None and profit_rate is not None:
-            correlations.append({
-                "execution_id": exec.id,
-                "indicator_type": indicator_type,
-                "indicator_value": indicator_value,
-                "profit_rate": profit_rate,
-                "executed_at": exec.executed_at.isoformat(),
-            })
+    # 실행 기록과 지표를 서버 측 커서로 배치 단위 스트리밍
+    statement = executions.order_by(LLMTradingExecution.id).statement.execution_options(
+        yield_per=STATISTICS_FETCH_BATCH_SIZE
+    )
     
+    # 배치마다 지표 값이 있는 행만 벡터 연산으로 골라 결과에 추가 (수익률은 SQL 조건으로 항상 존재)
+    correlations: List[Dict] = []
+    for partition in db.execute(statement).partitions():
+        correlations.extend(_build_indicator_correlation_rows(partition, indicator_type))
     return correlations
-
@@ -14,6 +14,8 @@ from sqlalchemy import desc
 
 from app.core.config import LLMAccountConfig, UpbitAPIConfig
 from app.db.database import UpbitAccounts, UpbitTicker, LLMTradingSignal, LLMTradingExecution
+from app.services.llm_response_validator import invalidate_balance_cache
+from app.services.statistics_service import invalidate_statistics_cache
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +87,8 @@ class TradingSimulator:
                 self.db.add(coin_account)
             
             self.db.commit()
+            invalidate_balance_cache(account_id_str)
+            invalidate_statistics_cache()
             
             logger.info(f"✅ 계좌 {account_id_str} 초기화 완료 (KRW: {INITIAL_CAPITAL_KRW:,})")
             return True
@@ -688,6 +692,9 @@ class TradingSimulator:
         
         try:
             self.db.commit()
+            # 검증 단계의 잔액/거부 캐시와 통계 캐시가 체결 전 데이터를 쓰지 않도록 무효화
+            invalidate_balance_cache(account_id_str, currency)
+            invalidate_statistics_cache()
             logger.info(f"        ✅ [_update_balance 완료] upbit_accounts에 저장됨")
         except Exception as e:
             logger.error(f"        ❌ [_update_balance 실패] DB 커밋 오류: {e}")
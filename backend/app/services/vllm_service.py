@@ -17,7 +17,7 @@ from app.schemas.llm import TradeDecision
 from app.services.llm_prompt_generator import LLMPromptGenerator
 from app.services.vllm_model_registry import get_preferred_model_name
 from app.services.trading_simulator import TradingSimulator
-from app.services.llm_response_validator import validate_trade_decision, build_retry_prompt
+from app.services.llm_response_validator import validate_trade_decision, validate_trade_decisions, build_retry_prompt
 from app.core.prompts import STRATEGY_PROMPTS, TradingStrategy
 
 logger = logging.getLogger(__name__)
@@ -245,7 +245,7 @@ async def get_trade_decision(
     raw_content = ""  # 예외 처리에서 참조할 수 있도록 초기화
     try:
         generator = LLMPromptGenerator(db)
-        prompt_data = generator.generate_and_save() # generate_and_save() 호출
+        prompt_data = await generator.generate_and_save_async() # generate_and_save_async() 호출
         if not prompt_data:
             raise ValueError("프롬프트 데이터를 생성하지 못했습니다.")
 
@@ -311,6 +311,13 @@ Based on the information above, please make a trading decision. You must respond
             logger.error(f"   completion 내용 (처음 500자): {str(completion)[:500]}")
             raise ValueError(f"LLM 응답에서 content를 추출할 수 없습니다: {e}") from e
 
+        # 프롬프트 캐시 적중 토큰 수 로깅 (OpenAI 호환 API가 usage.prompt_tokens_details를 제공하는 경우)
+        usage = getattr(completion, "usage", None)
+        prompt_tokens_details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(prompt_tokens_details, "cached_tokens", None)
+        if cached_tokens is not None:
+            logger.info(f"📦 프롬프트 캐시 적중: {cached_tokens}/{usage.prompt_tokens} 토큰")
+
         # 빈 응답 체크
         if not raw_content or not raw_content.strip():
             logger.error(f"❌ vLLM API가 빈 응답을 반환했습니다.")
@@ -375,7 +382,9 @@ Based on the information above, please make a trading decision. You must respond
         final_decision = None
         saved_signals = []
 
-        # ========== 3단계: 배열의 각 요소를 처리하고 저장 ==========
+        # ========== 3단계: 배열의 각 요소를 파싱/검증하고 저장 ==========
+        # 먼저 모든 요소를 TradeDecision으로 변환한 뒤, 현재가/잔액을 한 번에 조회하는 일괄 검증 수행
+        parsed_items = []  # (idx, TradeDecision, thinking)
         for idx, item_data in enumerate(decision_list):
             logger.info(f"📝 [{idx+1}/{len(decision_list)}] 거래 결정 처리 중...")
 
@@ -408,15 +417,18 @@ Based on the information above, please make a trading decision. You must respond
             if account_id is None:
                 account_id = _resolve_account_id(db, model, validated_decision)
 
-            # 거래 결정 검증
-            is_valid, validation_errors = validate_trade_decision(
-                validated_decision,
-                account_id,
-                db,
-                prompt_id=prompt_data.id,
-                signal_created_at=datetime.utcnow()
-            )
+            parsed_items.append((idx, validated_decision, item_thinking))
+
+        # 거래 결정 일괄 검증 (현재가/잔액 조회와 검증 실패 기록 커밋을 결정 수와 관계없이 한 번씩만 수행)
+        validation_results = validate_trade_decisions(
+            [decision for _, decision, _ in parsed_items],
+            account_id,
+            db,
+            prompt_id=prompt_data.id,
+            signal_created_at=datetime.utcnow()
+        )
 
+        for (idx, validated_decision, item_thinking), (is_valid, validation_errors) in zip(parsed_items, validation_results):
             if is_valid:
                 logger.info(f"✅ [{idx+1}] 검증 통과! llm_trading_signal에 저장합니다.")
                 saved_signal = _save_trading_signal(
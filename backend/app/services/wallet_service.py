@@ -27,6 +27,7 @@ from app.db.database import (
     LLMTradingSignal,
     AccountInformation
 )
+from app.services.statistics_service import invalidate_statistics_cache
 
 if TYPE_CHECKING:
     from app.services.connection_manager import ConnectionManager
@@ -454,6 +455,7 @@ async def save_account_information(db: Session, target_date: Optional[datetime]
         
         # 일괄 커밋
         db.commit()
+        invalidate_statistics_cache()
         
         logger.info(f"✅ AccountInformation 저장 완료: {saved_count}개 레코드")
         return saved_count
@@ -803,7 +803,7 @@ async def generate_llm_prompt(
                 logger.warning(f"⚠️ 거래 시작 시각 파싱 실패: {e}")
         
         generator = LLMPromptGenerator(db, trading_start_time)
-        prompt_data = generator.generate_and_save()
+        prompt_data = await generator.generate_and_save_async()
         
         if prompt_data:
             return {